@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark the time taken to import the engine modules.
+
+Imports every module in a fresh interpreter with ``-X importtime``, keeps the
+fastest of several runs and reports the heaviest modules it imports::
+
+    $ python benchmarks/bench_import_time.py --max-ms 800
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+DEFAULT_MODULES = [
+    "reana_workflow_engine_snakemake.cli",
+    "reana_workflow_engine_snakemake.runner",
+]
+
+MODULES_LOADED_LAZILY = {
+    "reana_workflow_engine_snakemake.cli": ["snakemake"],
+}
+"""Packages that must not be imported until the workflow is reported running."""
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into ``(module, self_us, cumulative_us)``."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # Header line
+            continue
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def run_benchmark(module, runs, top):
+    """Import a module ``runs`` times and collect the fastest import times."""
+    best = None
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imports = parse_importtime(process.stderr)
+        total_us = next(
+            cumulative_us for name, _, cumulative_us in imports if name == module
+        )
+        if best is None or total_us < best[0]:
+            best = (total_us, imports)
+    total_us, imports = best
+
+    loaded = {name.split(".")[0] for name, _, _ in imports}
+    return {
+        "module": module,
+        "total_ms": total_us / 1000,
+        "imported_modules": len(imports),
+        "unexpected": sorted(
+            package
+            for package in MODULES_LOADED_LAZILY.get(module, [])
+            if package in loaded
+        ),
+        "heaviest": [
+            {"module": name, "self_ms": self_us / 1000}
+            for name, self_us, _ in sorted(imports, key=lambda i: i[1], reverse=True)[
+                :top
+            ]
+        ],
+    }
+
+
+def print_results(results):
+    """Print the results, with the heaviest imports of every module."""
+    for result in results:
+        print(
+            f"{result['module']}: {result['total_ms']:.1f} ms, "
+            f"{result['imported_modules']} modules imported"
+        )
+        if result["unexpected"]:
+            print(f"  imported too early: {', '.join(result['unexpected'])}")
+        for heaviest in result["heaviest"]:
+            print(f"  {heaviest['self_ms']:8.1f} ms  {heaviest['module']}")
+
+
+def main(argv=None):
+    """Run the benchmarks selected on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--module",
+        action="append",
+        help="module to import, can be repeated (default: cli and runner)",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="number of imports of each module, the fastest is kept (default: 5)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="number of heaviest imports to show (default: 10)",
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="fail if importing the first module takes longer than this",
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_benchmark(module, args.runs, args.top)
+        for module in args.module or DEFAULT_MODULES
+    ]
+    print_results(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if any(result["unexpected"] for result in results):
+        return 1
+    if args.max_ms is not None and results[0]["total_ms"] > args.max_ms:
+        print(f"{results[0]['module']} takes longer than {args.max_ms} ms to import")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
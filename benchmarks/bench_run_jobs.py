@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmark the engine overhead of running Snakemake workflows.
+
+Runs ``runner.run_jobs`` on synthetic Snakefiles of various shapes and sizes
+against an in-process job-controller and a recording MQ publisher, and
+reports where the time goes::
+
+    $ python benchmarks/bench_run_jobs.py --shape wide --shape chain --jobs 10 100
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Poll as often as possible, the fake job-controller answers right away.
+os.environ.setdefault("REANA_POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS", "0.1")
+os.environ.setdefault("REANA_POLL_JOBS_STATUS_MAX_SLEEP_IN_SECONDS", "1")
+
+from fakes import (  # noqa: E402
+    FakeJobControllerAPIClient,
+    RecordingWorkflowStatusPublisher,
+)
+
+SNAKEFILES = {
+    # One job producing each output, all independent from each other.
+    "wide": """
+rule all:
+    input: expand("wide_{{i}}.txt", i=range({jobs}))
+
+rule make:
+    output: "wide_{{i}}.txt"
+    shell: "touch {{output}}"
+""",
+    # Every job depends on the previous one.
+    "chain": """
+rule all:
+    input: "chain_{last}.txt"
+
+rule step:
+    input: lambda wildcards: [] if int(wildcards.i) == 0 else f"chain_{{int(wildcards.i) - 1}}.txt"
+    output: "chain_{{i}}.txt"
+    shell: "touch {{output}}"
+""",
+    # One source fanning out to many jobs, merged back into one sink.
+    "diamond": """
+rule all:
+    input: "diamond_sink.txt"
+
+rule source:
+    output: "diamond_source.txt"
+    shell: "touch {{output}}"
+
+rule middle:
+    input: "diamond_source.txt"
+    output: "diamond_middle_{{i}}.txt"
+    shell: "touch {{output}}"
+
+rule sink:
+    input: expand("diamond_middle_{{i}}.txt", i=range({middle}))
+    output: "diamond_sink.txt"
+    shell: "touch {{output}}"
+""",
+}
+
+
+def write_snakefile(workspace, shape, jobs):
+    """Write a Snakefile of the given shape with about ``jobs`` jobs."""
+    snakefile = SNAKEFILES[shape].format(
+        jobs=jobs, last=jobs - 1, middle=max(jobs - 2, 1)
+    )
+    path = Path(workspace) / "Snakefile"
+    path.write_text(snakefile)
+    return path.name
+
+
+def run_benchmark(shape, jobs, latency, failure_rate, job_runtime):
+    """Run one workflow and collect its metrics."""
+    from reana_workflow_engine_snakemake import runner
+    from snakemake.workflow import Workflow
+
+    controller = FakeJobControllerAPIClient(
+        latency=latency, failure_rate=failure_rate, job_runtime=job_runtime, seed=0
+    )
+    publisher = RecordingWorkflowStatusPublisher()
+    parse_time = {}
+    original_include = Workflow.include
+
+    def timed_include(self, *args, **kwargs):
+        # Snakefiles are parsed lazily, when the DAG is first built.
+        started = time.perf_counter()
+        try:
+            return original_include(self, *args, **kwargs)
+        finally:
+            parse_time["finished"] = time.perf_counter()
+            parse_time["seconds"] = parse_time.get("seconds", 0.0) + (
+                parse_time["finished"] - started
+            )
+
+    with tempfile.TemporaryDirectory() as workspace:
+        os.environ["workflow_uuid"] = "benchmark"
+        os.environ["workflow_workspace"] = workspace
+        workflow_file = write_snakefile(workspace, shape, jobs)
+        with patch(
+            "reana_workflow_engine_snakemake.executor.JobControllerAPIClient",
+            controller,
+        ), patch(
+            "reana_workflow_engine_snakemake.executor.WorkflowStatusPublisher",
+            publisher,
+        ), patch.object(
+            Workflow, "include", timed_include
+        ):
+            started = time.perf_counter()
+            success = runner.run_jobs(
+                workspace, workflow_file, {}, operational_options={}
+            )
+            wall = time.perf_counter() - started
+        controller.shutdown()
+
+    submits = controller.submit_stats
+    submit_span = (submits.last - submits.first) if submits.count else 0.0
+    return {
+        "shape": shape,
+        "jobs": jobs,
+        "success": success,
+        "wall_seconds": wall,
+        "parse_seconds": parse_time.get("seconds"),
+        "dag_seconds": (
+            submits.first - parse_time["finished"]
+            if submits.count and "finished" in parse_time
+            else None
+        ),
+        "submitted": submits.count,
+        "submit_rate_per_second": (
+            submits.count / submit_span if submit_span > 0 else None
+        ),
+        "status_requests": controller.status_stats.count,
+        "list_requests": controller.list_stats.count,
+        "poll_seconds": controller.status_stats.seconds + controller.list_stats.seconds,
+        "mq_messages": len(publisher.messages),
+        "overhead_per_job_ms": 1000
+        * max(wall - job_runtime, 0.0)
+        / max(submits.count, 1),
+    }
+
+
+def print_results(results):
+    """Print the results as a table."""
+    columns = [
+        ("shape", "shape", "{}"),
+        ("jobs", "jobs", "{}"),
+        ("ok", "success", "{}"),
+        ("wall s", "wall_seconds", "{:.2f}"),
+        ("parse s", "parse_seconds", "{:.2f}"),
+        ("dag s", "dag_seconds", "{:.2f}"),
+        ("submit/s", "submit_rate_per_second", "{:.1f}"),
+        ("status req", "status_requests", "{}"),
+        ("list req", "list_requests", "{}"),
+        ("poll s", "poll_seconds", "{:.2f}"),
+        ("mq msgs", "mq_messages", "{}"),
+        ("ms/job", "overhead_per_job_ms", "{:.1f}"),
+    ]
+    rows = [[title for title, _, _ in columns]]
+    for result in results:
+        rows.append(
+            [
+                "-" if result[key] is None else fmt.format(result[key])
+                for _, key, fmt in columns
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    for row in rows:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+
+
+def main(argv=None):
+    """Run the benchmarks selected on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--shape",
+        action="append",
+        choices=sorted(SNAKEFILES),
+        help="workflow shape, can be repeated (default: all)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=[10, 100],
+        help="number of jobs of each workflow (default: 10 100)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds taken by every job-controller request",
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=0.0,
+        help="probability of every job to fail",
+    )
+    parser.add_argument(
+        "--job-runtime", type=float, default=0.0, help="seconds every job runs"
+    )
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_benchmark(shape, jobs, args.latency, args.failure_rate, args.job_runtime)
+        for shape in args.shape or sorted(SNAKEFILES)
+        for jobs in args.jobs
+    ]
+    print_results(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0 if all(result["success"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
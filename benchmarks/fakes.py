@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""In-process stand-ins for REANA services used by the benchmarks."""
+
+import random
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+
+class CallStats:
+    """Thread-safe count and cumulated duration of calls."""
+
+    def __init__(self):
+        """Initialise empty statistics."""
+        self._lock = threading.Lock()
+        self.count = 0
+        self.seconds = 0.0
+        self.first = None
+        self.last = None
+
+    def record(self, started, finished):
+        """Record a call that ran between the given times."""
+        with self._lock:
+            self.count += 1
+            self.seconds += finished - started
+            self.first = started if self.first is None else min(self.first, started)
+            self.last = finished if self.last is None else max(self.last, finished)
+
+
+class _Result:
+    """Bravado-like future whose result is already known."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def result(self, timeout=None):
+        return self._response, SimpleNamespace(status_code=200)
+
+
+class _RawResult:
+    """Bravado-like future giving access to the raw HTTP response."""
+
+    def __init__(self, body):
+        self.future = SimpleNamespace(
+            result=lambda timeout=None: SimpleNamespace(
+                status_code=200, raise_for_status=lambda: None, json=lambda: body
+            )
+        )
+
+
+class _FakeJobsResource:
+    """Stand-in for the ``jobs`` resource of the job-controller bravado client."""
+
+    def __init__(self, controller):
+        self._controller = controller
+
+    def get_jobs(self):
+        return _RawResult(self._controller.list_jobs())
+
+    def delete_job(self, job_id, compute_backend=None):
+        self._controller.delete_job(job_id)
+        return _Result(None)
+
+
+class FakeJobControllerAPIClient:
+    """In-process stand-in for ``JobControllerAPIClient``.
+
+    Submitted commands are run locally with ``bash`` by a pool of workers,
+    after an optional simulated runtime, so that Snakemake finds the outputs
+    it expects. Every API call takes ``latency`` seconds, and jobs fail with
+    probability ``failure_rate``.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        failure_rate=0.0,
+        job_runtime=0.0,
+        workers=32,
+        seed=None,
+    ):
+        """Initialise the fake job-controller."""
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.job_runtime = job_runtime
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._statuses = {}
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._client = SimpleNamespace(jobs=_FakeJobsResource(self))
+        self.submit_stats = CallStats()
+        self.status_stats = CallStats()
+        self.list_stats = CallStats()
+        self.delete_stats = CallStats()
+
+    def __call__(self, *args, **kwargs):
+        """Return itself, so that it can replace the client class."""
+        return self
+
+    def submit(self, **job_request_body):
+        """Queue a job and return its id."""
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self._statuses[job_id] = "queued"
+            fail = self._random.random() < self.failure_rate
+        self._pool.submit(self._run, job_id, job_request_body["cmd"], fail)
+        self.submit_stats.record(started, time.perf_counter())
+        return {"job_id": job_id}
+
+    def check_status(self, job_id):
+        """Get the status of a job."""
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        with self._lock:
+            status = self._statuses.get(job_id, "failed")
+        self.status_stats.record(started, time.perf_counter())
+        return SimpleNamespace(status=status)
+
+    def list_jobs(self):
+        """List the status of all jobs."""
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        with self._lock:
+            jobs = {
+                "jobs": {
+                    job_id: {"job_id": job_id, "status": status}
+                    for job_id, status in self._statuses.items()
+                }
+            }
+        self.list_stats.record(started, time.perf_counter())
+        return jobs
+
+    def delete_job(self, job_id):
+        """Stop a job."""
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        with self._lock:
+            self._statuses[job_id] = "stopped"
+        self.delete_stats.record(started, time.perf_counter())
+
+    def shutdown(self):
+        """Stop running jobs."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, job_id, cmd, fail):
+        with self._lock:
+            if self._statuses[job_id] == "stopped":
+                return
+            self._statuses[job_id] = "running"
+        time.sleep(self.job_runtime)
+        if fail:
+            status = "failed"
+        else:
+            result = subprocess.run(["bash", "-c", cmd], capture_output=True)
+            status = "finished" if result.returncode == 0 else "failed"
+        with self._lock:
+            if self._statuses[job_id] != "stopped":
+                self._statuses[job_id] = status
+
+
+class RecordingWorkflowStatusPublisher:
+    """Stand-in for ``WorkflowStatusPublisher`` keeping every message."""
+
+    def __init__(self):
+        """Initialise an empty message list."""
+        self._lock = threading.Lock()
+        self.messages = []
+
+    def __call__(self, *args, **kwargs):
+        """Return itself, so that it can replace the publisher class."""
+        return self
+
+    def publish_workflow_status(self, workflow_uuid, status, logs="", message=None):
+        """Record a workflow status message."""
+        with self._lock:
+            self.messages.append(
+                {
+                    "time": time.perf_counter(),
+                    "workflow_uuid": workflow_uuid,
+                    "status": status,
+                    "logs": logs,
+                    "message": message,
+                }
+            )
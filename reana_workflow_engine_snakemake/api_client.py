@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job-controller HTTP client."""
+
+from typing import Dict, Tuple
+
+from bravado.requests_client import RequestsClient
+from requests.adapters import HTTPAdapter
+
+from reana_workflow_engine_snakemake.config import (
+    JOB_CONTROLLER_HTTP_CONNECT_TIMEOUT_IN_SECONDS,
+    JOB_CONTROLLER_HTTP_POOL_SIZE,
+    JOB_CONTROLLER_HTTP_READ_TIMEOUT_IN_SECONDS,
+)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter keeping connections alive in a pool of configurable size.
+
+    Requests sent without an explicit timeout get the default one, and the
+    adapter can report how many connections it opened for how many requests,
+    which shows whether connections are being reused.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = JOB_CONTROLLER_HTTP_POOL_SIZE,
+        timeout: Tuple[float, float] = (
+            JOB_CONTROLLER_HTTP_CONNECT_TIMEOUT_IN_SECONDS,
+            JOB_CONTROLLER_HTTP_READ_TIMEOUT_IN_SECONDS,
+        ),
+    ):
+        """Initialise the adapter with a pool of ``pool_size`` connections."""
+        super().__init__(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.timeout = timeout
+
+    def send(self, request, timeout=None, **kwargs):
+        """Send the request, applying the default timeout if none is given."""
+        return super().send(
+            request, timeout=timeout if timeout is not None else self.timeout, **kwargs
+        )
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Get the number of connections opened and requests sent so far."""
+        stats = {"connections": 0, "requests": 0}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats["connections"] += pool.num_connections
+            stats["requests"] += pool.num_requests
+        return stats
+
+
+def create_http_client(adapter: PooledHTTPAdapter) -> RequestsClient:
+    """Create a bravado HTTP client sending all its requests through ``adapter``."""
+    http_client = RequestsClient(ssl_verify=False)
+    http_client.session.mount("http://", adapter)
+    http_client.session.mount("https://", adapter)
+    return http_client
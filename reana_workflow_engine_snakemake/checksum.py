@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake workspace file checksums."""
+
+import hashlib
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from reana_workflow_engine_snakemake.config import (
+    CHECKSUM_CHUNK_SIZE,
+    CHECKSUM_MAX_WORKERS,
+    LOGGING_MODULE,
+)
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+def _hash_chunk(path: str, offset: int, length: int) -> bytes:
+    """Compute the SHA-256 digest of a chunk of a file, mapping it in memory."""
+    digest = hashlib.sha256()
+    if length:
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), length, access=mmap.ACCESS_READ, offset=offset
+        ) as data:
+            digest.update(data)
+    return digest.digest()
+
+
+class ChecksumService:
+    """Compute the checksums of workspace files, reusing the ones of unchanged files.
+
+    Files are split in chunks of ``chunk_size`` bytes, hashed separately in a
+    pool of processes. The checksum of a file that fits in one chunk is its
+    SHA-256 digest, otherwise it is the SHA-256 digest of its chunk digests.
+    The checksum of a directory is computed from the paths and checksums of
+    the files in it.
+
+    Checksums are kept in an index, saved to ``index_path`` if given, keyed
+    by the path, size and modification time of the files, so that files that
+    did not change are never read again.
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        max_workers: int = CHECKSUM_MAX_WORKERS,
+        chunk_size: int = CHECKSUM_CHUNK_SIZE,
+    ):
+        """Initialise the service, loading the index at ``index_path``."""
+        if chunk_size % mmap.ALLOCATIONGRANULARITY:
+            raise ValueError(
+                f"Chunk size must be a multiple of {mmap.ALLOCATIONGRANULARITY} bytes"
+            )
+        self.index_path = index_path
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pool = None
+        self._index: Dict[str, Tuple[int, int, str]] = {}
+        self._index_changed = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the checksums of previous runs."""
+        if self.index_path is None:
+            return
+        try:
+            with open(self.index_path) as f:
+                self._index = {
+                    path: tuple(entry) for path, entry in json.load(f).items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as exception:
+            log.warning(f"Could not load checksum index {self.index_path}: {exception}")
+
+    def save(self) -> None:
+        """Save the index, replacing it atomically, if it changed."""
+        with self._lock:
+            if self.index_path is None or not self._index_changed:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+                with open(f"{self.index_path}.tmp", "w") as f:
+                    json.dump(self._index, f)
+                os.replace(f"{self.index_path}.tmp", self.index_path)
+                self._index_changed = False
+            except OSError as exception:
+                log.warning(f"Could not save checksum index: {exception}")
+
+    def close(self) -> None:
+        """Save the index and stop the hashing processes."""
+        self.save()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def checksum(self, path: str) -> str:
+        """Get the checksum of a file or directory."""
+        return self.checksums([path])[path]
+
+    def checksums(self, paths: Iterable[str]) -> Dict[str, str]:
+        """Get the checksums of several files or directories at once.
+
+        Raise ``OSError`` if one of them cannot be read.
+        """
+        paths = list(paths)
+        files_by_path = {path: self._list_files(path) for path in paths}
+        stats = {
+            file_path: os.stat(file_path)
+            for files in files_by_path.values()
+            for file_path, _ in files
+        }
+
+        checksums = {}
+        stale = []
+        with self._lock:
+            for file_path, stat in stats.items():
+                entry = self._index.get(os.path.abspath(file_path))
+                if entry is not None and entry[:2] == (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ):
+                    checksums[file_path] = entry[2]
+                    self.hits += 1
+                else:
+                    stale.append(file_path)
+                    self.misses += 1
+
+        computed = self._compute(
+            [(file_path, stats[file_path].st_size) for file_path in stale]
+        )
+        with self._lock:
+            for file_path, checksum in computed.items():
+                stat = stats[file_path]
+                self._index[os.path.abspath(file_path)] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    checksum,
+                )
+                self._index_changed = True
+        checksums.update(computed)
+
+        result = {}
+        for path, files in files_by_path.items():
+            if os.path.isdir(path):
+                digest = hashlib.sha256()
+                for file_path, relative_path in files:
+                    digest.update(f"{relative_path}\0{checksums[file_path]}\n".encode())
+                result[path] = digest.hexdigest()
+            else:
+                result[path] = checksums[path]
+        return result
+
+    @staticmethod
+    def _list_files(path: str) -> List[Tuple[str, str]]:
+        """List the files to hash for ``path``, with their path relative to it."""
+        if not os.path.isdir(path):
+            return [(path, os.path.basename(path))]
+        files = []
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            for name in sorted(names):
+                file_path = os.path.join(root, name)
+                files.append((file_path, os.path.relpath(file_path, path)))
+        return files
+
+    def _compute(self, files: List[Tuple[str, int]]) -> Dict[str, str]:
+        """Hash files, in parallel if there is more than one chunk's worth to read."""
+        chunks = [
+            (path, offset, min(self.chunk_size, size - offset))
+            for path, size in files
+            for offset in range(0, max(size, 1), self.chunk_size)
+        ]
+        # Starting the processes is only worth it for large amounts of data.
+        if (
+            self.max_workers > 1
+            and sum(length for _, _, length in chunks) > self.chunk_size
+        ):
+            digests = list(
+                self._get_pool().map(
+                    _hash_chunk,
+                    *zip(*chunks),
+                    chunksize=max(len(chunks) // (self.max_workers * 4), 1),
+                )
+            )
+        else:
+            digests = [_hash_chunk(*chunk) for chunk in chunks]
+
+        digests_by_path: Dict[str, List[bytes]] = {}
+        for (path, _, _), digest in zip(chunks, digests):
+            digests_by_path.setdefault(path, []).append(digest)
+        return {
+            path: (
+                digests[0].hex()
+                if len(digests) == 1
+                else hashlib.sha256(b"".join(digests)).hexdigest()
+            )
+            for path, digests in digests_by_path.items()
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the pool of hashing processes, starting it on first use."""
+        with self._lock:
+            if self._pool is None:
+                # The engine runs several threads, which forked processes
+                # would inherit in an undefined state.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
@@ -10,6 +10,9 @@
 
 import logging
 import os
+import sys
+
+import click
 
 from reana_commons.config import (
     REANA_LOG_FORMAT,
@@ -19,7 +22,7 @@ from reana_commons.config import (
 from reana_commons.workflow_engine import create_workflow_engine_command
 
 from reana_workflow_engine_snakemake.config import LOGGING_MODULE
-from reana_workflow_engine_snakemake.runner import run_jobs
+from reana_workflow_engine_snakemake.utils import set_workflow_identity
 
 logging.basicConfig(level=REANA_LOG_LEVEL, format=REANA_LOG_FORMAT)
 log = logging.getLogger(LOGGING_MODULE)
@@ -39,13 +42,14 @@ def run_snakemake_workflow_engine_adapter(
     running_status = 1
     finsihed_status = 2
     failed_status = 3
-    # use some shared object between tasks.
-    os.environ["workflow_uuid"] = workflow_uuid
-    os.environ["workflow_workspace"] = workflow_workspace
+    set_workflow_identity(workflow_uuid, workflow_workspace)
     os.umask(REANA_WORKFLOW_UMASK)
 
     log.info(f"Workflow spec received: {workflow_file}")
     publisher.publish_workflow_status(workflow_uuid, running_status)
+    # Snakemake is slow to import, only do so once the workflow is reported running.
+    from reana_workflow_engine_snakemake.runner import run_jobs
+
     success = run_jobs(
         workflow_workspace,
         workflow_file,
@@ -63,3 +67,14 @@ def run_snakemake_workflow_engine_adapter(
 run_snakemake_workflow = create_workflow_engine_command(
     run_snakemake_workflow_engine_adapter, engine_type="snakemake"
 )
+
+
+@click.command()
+@click.argument("workflow_workspace", type=click.Path(exists=True, file_okay=False))
+def generate_snakemake_report(workflow_workspace):
+    """Generate the Snakemake report of a run in the ``lazy`` report mode."""
+    os.umask(REANA_WORKFLOW_UMASK)
+    from reana_workflow_engine_snakemake.runner import generate_report
+
+    if not generate_report(workflow_workspace):
+        sys.exit(1)
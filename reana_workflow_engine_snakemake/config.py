@@ -8,10 +8,24 @@
 
 """REANA Workflow Engine Snakemake configuration."""
 
-from distutils.util import strtobool
 import os
 from enum import Enum
 
+
+def strtobool(value: str) -> bool:
+    """Convert a string representation of truth to a boolean.
+
+    Same as ``distutils.util.strtobool``, without the cost of importing
+    ``distutils``, which is deprecated.
+    """
+    value = value.lower()
+    if value in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    if value in ("n", "no", "f", "false", "off", "0"):
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
+
+
 MOUNT_CVMFS = os.getenv("REANA_MOUNT_CVMFS", "false")
 
 WORKFLOW_KERBEROS = bool(strtobool(os.getenv("REANA_WORKFLOW_KERBEROS", "false")))
@@ -21,13 +35,242 @@ LOGGING_MODULE = "reana-workflow-engine-snakemake"
 """REANA Workflow Engine Snakemake logging module."""
 
 DEFAULT_SNAKEMAKE_REPORT_FILENAME = "report.html"
-"""Snakemake report default filename."""
+"""Snakemake report default filename.
+
+Reports named ``*.zip`` store the result files next to the HTML page instead
+of embedding them in it, which is recommended for large results.
+"""
+
+SNAKEMAKE_REPORT_MODES = ("sync", "lazy", "off")
+"""When the Snakemake report can be generated: before the workflow is reported
+finished, on demand with ``generate-snakemake-report`` once it is reported
+finished, or never."""
+
+DEFAULT_SNAKEMAKE_REPORT_MODE = "sync"
+"""Snakemake report default generation mode."""
+
+SNAKEMAKE_REPORT_MODE = os.getenv(
+    "REANA_SNAKEMAKE_REPORT_MODE", DEFAULT_SNAKEMAKE_REPORT_MODE
+)
+"""When to generate the Snakemake report, unless set in the operational options."""
 
 SNAKEMAKE_MAX_PARALLEL_JOBS = int(os.getenv("SNAKEMAKE_MAX_PARALLEL_JOBS", "300"))
 """Snakemake maximum number of jobs that can run in parallel."""
 
+SNAKEMAKE_LOG_FORMATS = ("text", "json")
+"""How Snakemake log records can be written: as plain text or as JSON lines."""
+
+SNAKEMAKE_LOG_FORMAT = os.getenv("REANA_SNAKEMAKE_LOG_FORMAT", "text")
+"""How Snakemake log records are written."""
+
+SNAKEMAKE_LOG_SAMPLE_RATE = int(os.getenv("REANA_SNAKEMAKE_LOG_SAMPLE_RATE", "1"))
+"""Write one of every given number of high-volume Snakemake log records.
+
+Zero drops them all. Warnings and errors are always written.
+"""
+
+SNAKEMAKE_LOG_SAMPLED_EVENTS = tuple(
+    event.strip()
+    for event in os.getenv(
+        "REANA_SNAKEMAKE_LOG_SAMPLED_EVENTS", "shellcmd,job_info,job_finished"
+    ).split(",")
+    if event.strip()
+)
+"""Snakemake log events emitted for every job, subject to sampling."""
+
+SNAKEMAKE_LOG_QUEUE_SIZE = int(os.getenv("REANA_SNAKEMAKE_LOG_QUEUE_SIZE", "10000"))
+"""Maximum number of Snakemake log records waiting to be written.
+
+Records below ``WARNING`` logged while the queue is full are dropped instead
+of blocking the scheduler. Warnings and errors are never dropped.
+"""
+
+RESTART_JOURNAL = bool(strtobool(os.getenv("REANA_RESTART_JOURNAL", "true")))
+"""Whether to keep a journal of the submitted jobs to reattach to them on restart."""
+
+RESTART_JOURNAL_FILE = os.path.join(".snakemake", "reana", "jobs.jsonl")
+"""Path, relative to the workspace, of the restart journal."""
+
+REPORT_REQUEST_FILE = os.path.join(".snakemake", "reana", "report.json")
+"""Path, relative to the workspace, of the settings of a report to generate later."""
+
+RESULT_CACHE = bool(strtobool(os.getenv("REANA_RESULT_CACHE", "false")))
+"""Whether to reuse the outputs of identical jobs run by previous workflow runs."""
+
+RESULT_CACHE_DIR = os.getenv(
+    "REANA_RESULT_CACHE_DIR", os.path.join(".snakemake", "reana", "results")
+)
+"""Directory, relative to the workspace unless absolute, of the job result cache."""
+
+CHECKSUM_INDEX_FILE = os.path.join(".snakemake", "reana", "checksums.json")
+"""Path, relative to the workspace, of the index of the workspace file checksums."""
+
+CHECKSUM_MAX_WORKERS = int(
+    os.getenv("REANA_CHECKSUM_MAX_WORKERS", str(min(os.cpu_count() or 1, 8)))
+)
+"""Maximum number of processes hashing workspace files in parallel."""
+
+CHECKSUM_CHUNK_SIZE = 64 * 1024 * 1024
+"""Number of bytes of a file hashed at once by one process."""
+
 POLL_JOBS_STATUS_SLEEP_IN_SECONDS = 10
-"""Time to sleep between polling for job status."""
+"""Initial time to sleep between polling for job status."""
+
+POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS = float(
+    os.getenv("REANA_POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS", "1")
+)
+"""Minimum time to sleep between polling for job status."""
+
+POLL_JOBS_STATUS_MAX_SLEEP_IN_SECONDS = float(
+    os.getenv("REANA_POLL_JOBS_STATUS_MAX_SLEEP_IN_SECONDS", "60")
+)
+"""Maximum time to sleep between polling for job status."""
+
+JOB_STATUS_WEBHOOK_PORT = (
+    int(os.getenv("REANA_JOB_STATUS_WEBHOOK_PORT"))
+    if os.getenv("REANA_JOB_STATUS_WEBHOOK_PORT")
+    else None
+)
+"""Port of the local endpoint receiving job status notifications, if enabled."""
+
+JOB_STATUS_WEBHOOK_HOST = os.getenv("REANA_JOB_STATUS_WEBHOOK_HOST", "127.0.0.1")
+"""Address the job status endpoint listens on."""
+
+JOB_STATUS_WEBHOOK_TOKEN = os.getenv("REANA_JOB_STATUS_WEBHOOK_TOKEN")
+"""Token the job status notifications have to carry.
+
+The endpoint is only enabled when both its port and its token are set.
+"""
+
+POLL_JOBS_STATUS_RECONCILIATION_IN_SECONDS = float(
+    os.getenv("REANA_POLL_JOBS_STATUS_RECONCILIATION_IN_SECONDS", "120")
+)
+"""Time between job-controller status checks when job statuses are notified."""
+
+POLL_JOBS_STATUS_BULK = bool(
+    strtobool(os.getenv("REANA_POLL_JOBS_STATUS_BULK", "true"))
+)
+"""Whether to fetch the status of all active jobs with one job-controller request."""
+
+POLL_JOBS_STATUS_MAX_WORKERS = int(
+    os.getenv("REANA_POLL_JOBS_STATUS_MAX_WORKERS", "20")
+)
+"""Maximum number of job status requests sent to job-controller concurrently."""
+
+PROGRESS_PUBLISH_INTERVAL_IN_SECONDS = float(
+    os.getenv("REANA_PROGRESS_PUBLISH_INTERVAL_IN_SECONDS", "5")
+)
+"""Maximum time job progress events are buffered before being published to MQ."""
+
+PROGRESS_PUBLISH_BATCH_SIZE = int(os.getenv("REANA_PROGRESS_PUBLISH_BATCH_SIZE", "100"))
+"""Number of buffered job progress events that triggers publishing to MQ."""
+
+SUBMIT_JOBS_MAX_WORKERS = int(os.getenv("REANA_SUBMIT_JOBS_MAX_WORKERS", "10"))
+"""Maximum number of jobs submitted to job-controller concurrently."""
+
+LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES = (
+    float(os.getenv("REANA_LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES"))
+    if os.getenv("REANA_LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES")
+    else None
+)
+"""Maximum ``runtime`` resource of the shell jobs run in the engine, if enabled.
+
+Such jobs run in the environment of the engine instead of their container.
+"""
+
+LOCAL_JOBS_MAX_WORKERS = int(os.getenv("REANA_LOCAL_JOBS_MAX_WORKERS", "4"))
+"""Maximum number of jobs run in the engine at the same time."""
+
+ADAPTIVE_CONCURRENCY = bool(strtobool(os.getenv("REANA_ADAPTIVE_CONCURRENCY", "false")))
+"""Whether to adapt the number of jobs in flight to how the cluster copes with them.
+
+``SNAKEMAKE_MAX_PARALLEL_JOBS`` remains the upper bound.
+"""
+
+SUBMIT_JOBS_BY_CRITICAL_PATH = bool(
+    strtobool(
+        os.getenv(
+            "REANA_SUBMIT_JOBS_BY_CRITICAL_PATH", str(ADAPTIVE_CONCURRENCY).lower()
+        )
+    )
+)
+"""Whether to submit the ready jobs holding up the longest chains of jobs first.
+
+Enabled with ``ADAPTIVE_CONCURRENCY`` by default, as only jobs held back by
+the concurrency limit wait for their turn. Otherwise all the ready jobs are
+submitted straight away.
+"""
+
+ADAPTIVE_CONCURRENCY_INITIAL = int(
+    os.getenv("REANA_ADAPTIVE_CONCURRENCY_INITIAL", str(SNAKEMAKE_MAX_PARALLEL_JOBS))
+)
+"""Number of jobs allowed in flight when the workflow starts."""
+
+ADAPTIVE_CONCURRENCY_MIN = int(os.getenv("REANA_ADAPTIVE_CONCURRENCY_MIN", "1"))
+"""Minimum number of jobs allowed in flight."""
+
+ADAPTIVE_CONCURRENCY_SUBMIT_LATENCY_IN_SECONDS = float(
+    os.getenv("REANA_ADAPTIVE_CONCURRENCY_SUBMIT_LATENCY_IN_SECONDS", "5")
+)
+"""Job submission time above which job-controller is considered overloaded."""
+
+ADAPTIVE_CONCURRENCY_QUEUED_RATIO = float(
+    os.getenv("REANA_ADAPTIVE_CONCURRENCY_QUEUED_RATIO", "0.5")
+)
+"""Share of queued jobs in flight above which the cluster is considered saturated."""
+
+ADAPTIVE_CONCURRENCY_QUEUED_GRACE_IN_SECONDS = float(
+    os.getenv("REANA_ADAPTIVE_CONCURRENCY_QUEUED_GRACE_IN_SECONDS", "60")
+)
+"""Time given to a submitted job to be scheduled before it counts as queued."""
+
+ADAPTIVE_CONCURRENCY_DECREASE_INTERVAL_IN_SECONDS = 10
+"""Minimum time between two reductions of the number of jobs allowed in flight."""
+
+CANCEL_JOBS_MAX_WORKERS = int(os.getenv("REANA_CANCEL_JOBS_MAX_WORKERS", "20"))
+"""Maximum number of jobs cancelled concurrently when Snakemake is interrupted."""
+
+CANCEL_JOBS_MAX_ATTEMPTS = int(os.getenv("REANA_CANCEL_JOBS_MAX_ATTEMPTS", "3"))
+"""Number of attempts to cancel a job before giving up."""
+
+CANCEL_JOBS_RETRY_DELAY_IN_SECONDS = 1
+"""Base delay between attempts to cancel a job, growing with every attempt."""
+
+JOB_CONTROLLER_HTTP_POOL_SIZE = int(
+    os.getenv(
+        "REANA_JOB_CONTROLLER_HTTP_POOL_SIZE",
+        str(
+            POLL_JOBS_STATUS_MAX_WORKERS
+            + SUBMIT_JOBS_MAX_WORKERS
+            + CANCEL_JOBS_MAX_WORKERS
+        ),
+    )
+)
+"""Maximum number of persistent connections kept open to job-controller."""
+
+JOB_CONTROLLER_HTTP_CONNECT_TIMEOUT_IN_SECONDS = float(
+    os.getenv("REANA_JOB_CONTROLLER_HTTP_CONNECT_TIMEOUT_IN_SECONDS", "10")
+)
+"""Timeout for opening a connection to job-controller."""
+
+JOB_CONTROLLER_HTTP_READ_TIMEOUT_IN_SECONDS = float(
+    os.getenv("REANA_JOB_CONTROLLER_HTTP_READ_TIMEOUT_IN_SECONDS", "300")
+)
+"""Timeout for receiving a response from job-controller."""
+
+METRICS_PORT = (
+    int(os.getenv("REANA_METRICS_PORT")) if os.getenv("REANA_METRICS_PORT") else None
+)
+"""Port of the local endpoint serving the executor metrics, if enabled."""
+
+METRICS_HOST = os.getenv("REANA_METRICS_HOST", "127.0.0.1")
+"""Address the metrics endpoint listens on."""
+
+METRICS_FILE = os.getenv("REANA_METRICS_FILE")
+"""Path, relative to the workspace, of the file the executor metrics are written to, if enabled."""
+
+METRICS_FILE_WRITE_INTERVAL_IN_SECONDS = 30
+"""Minimum time between two writes of the executor metrics file."""
 
 
 # defined in reana-db component, in reana_db/models.py file as JobStatus
@@ -8,18 +8,26 @@
 
 """REANA-Workflow-Engine-Snakemake executor."""
 
+import asyncio
+import heapq
+import itertools
 import os
 import logging
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Generator, Optional
+from http import HTTPStatus
+from typing import Dict, List, Generator, Optional, Tuple
 
-from bravado.exception import HTTPNotFound
+from bravado.exception import HTTPClientError, HTTPNotFound
 from reana_commons.config import REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE
-from reana_commons.utils import build_progress_message
 
 from reana_commons.api_client import JobControllerAPIClient
 from reana_commons.publisher import WorkflowStatusPublisher
 
+from snakemake import __version__ as snakemake_version
 from snakemake_interface_executor_plugins.executors.base import SubmittedJobInfo
 from snakemake_interface_executor_plugins.executors.remote import RemoteExecutor
 from snakemake_interface_executor_plugins.settings import (
@@ -30,17 +38,61 @@ from snakemake_interface_executor_plugins.jobs import (
 )
 from snakemake_interface_common.exceptions import WorkflowError
 
+from reana_workflow_engine_snakemake.api_client import (
+    PooledHTTPAdapter,
+    create_http_client,
+)
+from reana_workflow_engine_snakemake.checksum import ChecksumService
 from reana_workflow_engine_snakemake.config import (
+    ADAPTIVE_CONCURRENCY,
+    ADAPTIVE_CONCURRENCY_QUEUED_GRACE_IN_SECONDS,
+    CANCEL_JOBS_MAX_ATTEMPTS,
+    CANCEL_JOBS_MAX_WORKERS,
+    CANCEL_JOBS_RETRY_DELAY_IN_SECONDS,
+    CHECKSUM_INDEX_FILE,
+    JOB_STATUS_WEBHOOK_HOST,
+    JOB_STATUS_WEBHOOK_PORT,
+    JOB_STATUS_WEBHOOK_TOKEN,
+    LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES,
+    LOCAL_JOBS_MAX_WORKERS,
     LOGGING_MODULE,
+    METRICS_FILE,
+    METRICS_FILE_WRITE_INTERVAL_IN_SECONDS,
+    METRICS_HOST,
+    METRICS_PORT,
     MOUNT_CVMFS,
     WORKFLOW_KERBEROS,
-    POLL_JOBS_STATUS_SLEEP_IN_SECONDS,
+    POLL_JOBS_STATUS_BULK,
+    POLL_JOBS_STATUS_MAX_WORKERS,
+    POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+    POLL_JOBS_STATUS_RECONCILIATION_IN_SECONDS,
+    RESTART_JOURNAL,
+    RESTART_JOURNAL_FILE,
+    RESULT_CACHE,
+    RESULT_CACHE_DIR,
+    SUBMIT_JOBS_BY_CRITICAL_PATH,
+    SUBMIT_JOBS_MAX_WORKERS,
     JobStatus,
     RunStatus,
 )
+from reana_workflow_engine_snakemake.job_status import (
+    JobStatusTable,
+    JobStatusWebhook,
+)
+from reana_workflow_engine_snakemake.journal import JobJournal, build_job_key
+from reana_workflow_engine_snakemake.metrics import (
+    ExecutorMetrics,
+    InstrumentedPublisher,
+    MetricsServer,
+    summarise,
+)
+from reana_workflow_engine_snakemake.result_cache import ResultCache
 from reana_workflow_engine_snakemake.utils import (
-    publish_job_submission,
-    publish_workflow_start,
+    AdaptiveConcurrencyLimit,
+    AdaptivePollInterval,
+    CriticalPathPriority,
+    WorkflowProgress,
+    get_workflow_identity,
 )
 
 log = logging.getLogger(LOGGING_MODULE)
@@ -99,8 +151,110 @@ class Executor(RemoteExecutor):
 
         # In case of errors outside of jobs, please raise a WorkflowError
 
-        self.publisher = WorkflowStatusPublisher()
-        self.rjc_api_client = JobControllerAPIClient("reana-job-controller")
+        workflow_identity = get_workflow_identity()
+        self.workflow_uuid = workflow_identity.uuid
+        self.workflow_workspace = workflow_identity.workspace
+        # Fields of the job requests shared by the jobs of a rule, with the
+        # same environment and resources.
+        self.request_templates: Dict[Tuple, Dict] = {}
+
+        self.metrics = ExecutorMetrics()
+        self.metrics_server = None
+        if METRICS_PORT is not None:
+            self.metrics_server = MetricsServer(
+                self.metrics, host=METRICS_HOST, port=METRICS_PORT
+            )
+            self.metrics_server.start()
+        self.metrics_file = (
+            os.path.join(self.workflow_workspace, METRICS_FILE)
+            if METRICS_FILE
+            else None
+        )
+        self.last_metrics_write = time.monotonic()
+        # When each job was received, to measure how long it waits for submission.
+        self.job_ready_at: Dict[JobExecutorInterface, float] = {}
+
+        self.publisher = InstrumentedPublisher(WorkflowStatusPublisher(), self.metrics)
+        self.progress = WorkflowProgress(self.workflow_uuid, self.publisher)
+        # Share a pool of keep-alive connections between the submission, status
+        # check and cancellation threads.
+        self.http_adapter = PooledHTTPAdapter()
+        self.rjc_api_client = JobControllerAPIClient(
+            "reana-job-controller", http_client=create_http_client(self.http_adapter)
+        )
+        # Whether job-controller can be asked for the status of all jobs at once.
+        # Switched off on the first failure, after which jobs are polled one by one.
+        self.bulk_status_supported = POLL_JOBS_STATUS_BULK
+        self.status_check_pool = ThreadPoolExecutor(
+            max_workers=POLL_JOBS_STATUS_MAX_WORKERS,
+            thread_name_prefix="reana-status-check",
+        )
+        # Statuses pushed to the job status webhook, if enabled.
+        self.job_status_table = None
+        self.job_status_webhook = None
+        self.last_status_reconciliation = time.monotonic()
+        if JOB_STATUS_WEBHOOK_PORT is not None and not JOB_STATUS_WEBHOOK_TOKEN:
+            log.warning(
+                "Job status webhook disabled: REANA_JOB_STATUS_WEBHOOK_TOKEN is not set."
+            )
+        elif JOB_STATUS_WEBHOOK_PORT is not None:
+            self.job_status_table = JobStatusTable()
+            self.job_status_webhook = JobStatusWebhook(
+                self.job_status_table,
+                token=JOB_STATUS_WEBHOOK_TOKEN,
+                host=JOB_STATUS_WEBHOOK_HOST,
+                port=JOB_STATUS_WEBHOOK_PORT,
+            )
+            self.job_status_webhook.start()
+            # Checking the table is cheap, so look at it as often as allowed.
+            self.poll_interval = AdaptivePollInterval(
+                initial=POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+                ceiling=POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+            )
+        else:
+            self.poll_interval = AdaptivePollInterval()
+        self.next_seconds_between_status_checks = self.poll_interval.current
+        self.critical_path = (
+            CriticalPathPriority() if SUBMIT_JOBS_BY_CRITICAL_PATH else None
+        )
+        # Jobs are held back, highest priority first, while the number of jobs
+        # submitted and not done yet reaches the adaptive concurrency limit.
+        self.concurrency = AdaptiveConcurrencyLimit() if ADAPTIVE_CONCURRENCY else None
+        self.jobs_in_flight = 0
+        self.held_submissions: List[Tuple[int, int, JobExecutorInterface, Dict]] = []
+        self.held_submissions_order = itertools.count()
+        self.submissions_lock = threading.Lock()
+        # Jobs submitted by previous runs of the workflow, to reattach to them.
+        self.journal = None
+        if RESTART_JOURNAL:
+            self.journal = JobJournal(
+                os.path.join(self.workflow_workspace, RESTART_JOURNAL_FILE)
+            )
+        self.journal_keys: Dict[JobExecutorInterface, str] = {}
+        # Outputs of identical jobs run before, to restore instead of running them.
+        self.checksums = None
+        self.result_cache = None
+        if RESULT_CACHE:
+            self.checksums = ChecksumService(
+                os.path.join(self.workflow_workspace, CHECKSUM_INDEX_FILE)
+            )
+            self.result_cache = ResultCache(
+                os.path.join(self.workflow_workspace, RESULT_CACHE_DIR),
+                self.workflow_workspace,
+                checksums=self.checksums,
+            )
+        self.result_cache_keys: Dict[JobExecutorInterface, str] = {}
+        self.submission_pool = ThreadPoolExecutor(
+            max_workers=SUBMIT_JOBS_MAX_WORKERS,
+            thread_name_prefix="reana-job-submission",
+        )
+        # Short jobs run in the engine, to spare them the scheduling latency.
+        self.local_job_pool = None
+        if LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES is not None:
+            self.local_job_pool = ThreadPoolExecutor(
+                max_workers=LOCAL_JOBS_MAX_WORKERS,
+                thread_name_prefix="reana-local-job",
+            )
 
     def run_job(self, job: JobExecutorInterface):
         """Override generic executor run_job method."""
@@ -114,69 +268,47 @@ class Executor(RemoteExecutor):
         # If required, make sure to pass the job's id to the job_info object, as keyword
         # argument 'external_job_id'.
 
-        workflow_workspace = os.getenv("workflow_workspace", "default")
-        workflow_uuid = os.getenv("workflow_uuid", "default")
-        publish_workflow_start(
-            workflow_uuid=workflow_uuid, publisher=self.publisher, job=job
-        )
+        self.job_ready_at[job] = time.monotonic()
+        self.progress.start(job)
         try:
-            log.info(f"Job '{job.name}' received, command: {job.shellcmd}")
-            container_image = self._get_container_image(job)
+            if job.is_group():
+                # Group of jobs, run together as a single REANA job
+                log.info(f"Group job '{job.name}' received")
+                job_request_body = self._build_group_job_request_body(job)
+                self._queue_job_submission(job, job_request_body)
+                return
+
+            if job.is_shell and self._runs_locally(job):
+                # Short shell command, run in the engine
+                log.info(f"Job '{job.name}' received, running locally: {job.shellcmd}")
+                self.job_ready_at.pop(job, None)
+                self.local_job_pool.submit(self._run_and_report_local_job, job)
+                return
             if job.is_shell:
                 # Shell command
-                job_request_body = {
-                    "workflow_uuid": workflow_uuid,
-                    "image": container_image,
-                    "cmd": f"cd {workflow_workspace} && {job.shellcmd}",
-                    "prettified_cmd": job.shellcmd,
-                    "workflow_workspace": workflow_workspace,
-                    "job_name": self._build_job_name(job),
-                    "cvmfs_mounts": MOUNT_CVMFS,
-                    "compute_backend": job.resources.get("compute_backend", ""),
-                    "kerberos": job.resources.get("kerberos", WORKFLOW_KERBEROS),
-                    "unpacked_img": job.resources.get("unpacked_img", False),
-                    "kubernetes_uid": job.resources.get("kubernetes_uid"),
-                    "kubernetes_cpu_request": job.resources.get(
-                        "kubernetes_cpu_request"
-                    ),
-                    "kubernetes_cpu_limit": job.resources.get("kubernetes_cpu_limit"),
-                    "kubernetes_memory_request": job.resources.get(
-                        "kubernetes_memory_request"
-                    ),
-                    "kubernetes_memory_limit": job.resources.get(
-                        "kubernetes_memory_limit"
-                    ),
-                    "kubernetes_job_timeout": job.resources.get(
-                        "kubernetes_job_timeout"
-                    ),
-                    "voms_proxy": job.resources.get("voms_proxy", False),
-                    "rucio": job.resources.get("rucio", False),
-                    "htcondor_max_runtime": job.resources.get(
-                        "htcondor_max_runtime", ""
-                    ),
-                    "htcondor_accounting_group": job.resources.get(
-                        "htcondor_accounting_group", ""
-                    ),
-                    "slurm_partition": job.resources.get("slurm_partition"),
-                    "slurm_time": job.resources.get("slurm_time"),
-                    "c4p_cpu_cores": job.resources.get("c4p_cpu_cores"),
-                    "c4p_memory_limit": job.resources.get("c4p_memory_limit"),
-                    "c4p_additional_requirements": job.resources.get(
-                        "c4p_additional_requirements"
-                    ),
-                }
-                job_id = self._submit_job(
-                    self.rjc_api_client, self.publisher, job_request_body
+                log.info(f"Job '{job.name}' received, command: {job.shellcmd}")
+                job_request_body = self._build_job_request_body(
+                    job, job.shellcmd, self._get_container_image(job)
                 )
-                self.report_job_submission(
-                    SubmittedJobInfo(job=job, external_jobid=job_id)
+            else:
+                # Python code, run by Snakemake inside the job container
+                log.info(f"Job '{job.name}' received, running its code with Snakemake")
+                job_request_body = self._build_snakemake_job_request_body(
+                    job, self._get_container_image(job)
                 )
-            elif job.is_run:
-                # Python code
-                log.error("Python code execution is not supported yet.")
+            self._queue_job_submission(job, job_request_body)
         except Exception as e:
             log.error(f"Error submitting job {job.name}: {e}")
-            return
+            self._forget_job(job)
+            self.report_job_error(SubmittedJobInfo(job=job))
+
+    def run_jobs(self, jobs: List[JobExecutorInterface]):
+        """Override generic executor run_jobs method."""
+        if self.critical_path is not None:
+            # Submit the jobs on the longest remaining paths first.
+            jobs = sorted(jobs, key=self._get_priority, reverse=True)
+        super().run_jobs(jobs)
+        self._release_held_submissions()
 
     async def check_active_jobs(
         self, active_jobs: List[SubmittedJobInfo]
@@ -202,66 +334,321 @@ class Executor(RemoteExecutor):
         #    # query remote middleware here
         #
         # To modify the time until the next call of this method,
-        # you can set self.next_sleep_seconds here.
-
-        self.next_sleep_seconds = POLL_JOBS_STATUS_SLEEP_IN_SECONDS
+        # you can set self.next_seconds_between_status_checks here.
 
         log.debug(f"Checking status of {len(active_jobs)} jobs")
+        round_started = time.monotonic()
+        self.metrics.active_jobs.set(len(active_jobs))
+
+        statuses = await self._get_active_jobs_statuses(active_jobs)
+        now = time.monotonic()
+        jobs_done = 0
+        # Only the jobs given time to be scheduled tell whether the cluster is
+        # saturated, right after a burst of submissions most jobs are queued.
+        jobs_scheduled = 0
+        jobs_queued = 0
+        still_active_jobs = []
 
         for active_job in active_jobs:
-            async with self.status_rate_limiter:
-                try:
-                    job_id = active_job.external_jobid
-
-                    status = self._get_job_status_from_controller(job_id)
-
-                    if status == JobStatus.finished.name or active_job.job.is_norun:
-                        self.report_job_success(active_job)
-                        self._handle_job_status(
-                            active_job.external_jobid,
-                            active_job.job.name,
-                            job_status=JobStatus.finished,
-                            workflow_status=RunStatus.running,
+            try:
+                status = statuses[active_job.external_jobid]
+                if self.journal is not None:
+                    self.journal.update_status(active_job.external_jobid, status)
+
+                # Group jobs have no is_norun attribute.
+                if status == JobStatus.finished.name or getattr(
+                    active_job.job, "is_norun", False
+                ):
+                    jobs_done += 1
+                    self._record_job_runtime(active_job, now)
+                    self._job_left_flight()
+                    if self.concurrency is not None:
+                        self.concurrency.job_finished()
+                    result_key = self.result_cache_keys.pop(active_job.job, None)
+                    if result_key is not None:
+                        # Copying the outputs would hold up the status checks.
+                        self.submission_pool.submit(
+                            self._store_result_and_report_success,
+                            active_job,
+                            result_key,
                         )
+                    else:
+                        self._report_job_finished(active_job)
+
+                elif status in (
+                    JobStatus.failed.name,
+                    JobStatus.stopped.name,
+                ):
+                    jobs_done += 1
+                    self._record_job_runtime(active_job, now)
+                    self.result_cache_keys.pop(active_job.job, None)
+                    self._job_left_flight()
+                    self.report_job_error(active_job)
+                    self._handle_job_status(
+                        active_job.external_jobid,
+                        active_job.job,
+                        job_status=JobStatus.failed,
+                        workflow_status=RunStatus.failed,
+                    )
 
-                    elif status in (
-                        JobStatus.failed.name,
-                        JobStatus.stopped.name,
+                else:
+                    submitted_at = (active_job.aux or {}).get("submitted_at")
+                    if (
+                        submitted_at is not None
+                        and now - submitted_at
+                        >= ADAPTIVE_CONCURRENCY_QUEUED_GRACE_IN_SECONDS
                     ):
-                        self.report_job_error(active_job)
-                        self._handle_job_status(
-                            active_job.external_jobid,
-                            active_job.job.name,
-                            job_status=JobStatus.failed,
-                            workflow_status=RunStatus.failed,
-                        )
+                        jobs_scheduled += 1
+                        if status == JobStatus.queued.name:
+                            jobs_queued += 1
+                    still_active_jobs.append(active_job)
+                    yield active_job
 
-                    else:
-                        yield active_job
+            except WorkflowError as e:
+                log.error(
+                    f"Something went wrong while checking the status of the active jobs.\nError message{str(e)}"
+                )
+                self._job_left_flight()
+                self.report_job_error(active_job)
+
+        self.progress.flush_if_due()
+        self.metrics.active_jobs.set(len(still_active_jobs))
+        if self.concurrency is not None:
+            self.concurrency.jobs_checked(jobs_scheduled, jobs_queued)
+            self._release_held_submissions()
+            self.metrics.concurrency_limit.set(self.concurrency.current)
+        self.metrics.poll_round_seconds.observe(time.monotonic() - round_started)
+        self._write_metrics_file()
+        self.next_seconds_between_status_checks = self.poll_interval.next(
+            jobs_done,
+            (
+                (job_info.job.name, (job_info.aux or {}).get("submitted_at"))
+                for job_info in still_active_jobs
+            ),
+            now,
+        )
+        log.debug(
+            f"Next status check in {self.next_seconds_between_status_checks:.1f}s"
+        )
+
+    def _write_metrics_file(self, force: bool = False) -> None:
+        """Write the metrics file, if enabled, at most every few seconds."""
+        if self.metrics_file is None:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and now - self.last_metrics_write < METRICS_FILE_WRITE_INTERVAL_IN_SECONDS
+        ):
+            return
+        self.last_metrics_write = now
+        try:
+            self.metrics.write(self.metrics_file)
+        except OSError as exception:
+            log.warning(f"Could not write metrics to {self.metrics_file}: {exception}")
+
+    def _report_job_finished(self, job_info: SubmittedJobInfo) -> None:
+        """Report a job that finished successfully to Snakemake and REANA."""
+        self.report_job_success(job_info)
+        self._handle_job_status(
+            job_info.external_jobid,
+            job_info.job,
+            job_status=JobStatus.finished,
+            workflow_status=RunStatus.running,
+        )
 
-                except WorkflowError as e:
-                    log.error(
-                        f"Something went wrong while checking the status of the active jobs.\nError message{str(e)}"
+    def _record_job_runtime(self, job_info: SubmittedJobInfo, now: float) -> None:
+        """Record how long a job that is no longer running took."""
+        submitted_at = (job_info.aux or {}).get("submitted_at")
+        if submitted_at is not None:
+            self.poll_interval.job_done(job_info.job.name, submitted_at, now)
+
+    async def _get_active_jobs_statuses(
+        self, active_jobs: List[SubmittedJobInfo]
+    ) -> Dict[str, str]:
+        """Get the status of the active jobs without blocking the event loop.
+
+        When job status notifications are enabled, statuses are read from
+        ``self.job_status_table`` and job-controller is only asked about the
+        jobs without notifications every
+        ``POLL_JOBS_STATUS_RECONCILIATION_IN_SECONDS``.
+
+        The blocking job-controller requests run in ``self.status_check_pool``,
+        so that at most ``POLL_JOBS_STATUS_MAX_WORKERS`` of them are in flight
+        at the same time.
+        """
+        loop = asyncio.get_running_loop()
+
+        statuses = {}
+        if self.job_status_table is not None:
+            statuses = self.job_status_table.get_many(
+                active_job.external_jobid for active_job in active_jobs
+            )
+            now = time.monotonic()
+            if (
+                now - self.last_status_reconciliation
+                < POLL_JOBS_STATUS_RECONCILIATION_IN_SECONDS
+            ):
+                # Jobs that did not notify any status change are still running.
+                return {
+                    active_job.external_jobid: statuses.get(
+                        active_job.external_jobid, JobStatus.running.name
                     )
-                    self.report_job_error(active_job)
+                    for active_job in active_jobs
+                }
+            # Reconcile the jobs without notifications with job-controller.
+            self.last_status_reconciliation = now
+
+        # A round of status checks counts once against Snakemake's rate limit,
+        # the number of requests in flight being bounded by the pool.
+        async with self.status_rate_limiter:
+            if self.bulk_status_supported and len(statuses) < len(active_jobs):
+                bulk_statuses = await loop.run_in_executor(
+                    self.status_check_pool, self._get_jobs_status_from_controller
+                )
+                statuses = {**bulk_statuses, **statuses}
+
+            missing_job_ids = [
+                active_job.external_jobid
+                for active_job in active_jobs
+                if active_job.external_jobid not in statuses
+            ]
+            missing_statuses = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.status_check_pool,
+                        self._get_job_status_from_controller,
+                        job_id,
+                    )
+                    for job_id in missing_job_ids
+                )
+            )
+        statuses.update(zip(missing_job_ids, missing_statuses))
+        return statuses
 
     def cancel_jobs(self, active_jobs: List[SubmittedJobInfo]):
         """Override generic executor cancel_jobs method."""
         # Cancel all active jobs.
         # This method is called when Snakemake is interrupted.
 
-        for active_job in active_jobs:
-            job_id = active_job.external_jobid
+        with ThreadPoolExecutor(
+            max_workers=CANCEL_JOBS_MAX_WORKERS,
+            thread_name_prefix="reana-job-cancellation",
+        ) as cancellation_pool:
+            cancelled = list(cancellation_pool.map(self._cancel_job, active_jobs))
 
-            self.rjc_api_client.delete_job(job_id)
+        not_cancelled = [
+            active_job.external_jobid
+            for active_job, is_cancelled in zip(active_jobs, cancelled)
+            if not is_cancelled
+        ]
+        if not_cancelled:
+            log.error(
+                f"Could not cancel {len(not_cancelled)} of {len(active_jobs)} jobs: "
+                f"{', '.join(not_cancelled)}"
+            )
+        else:
+            log.info(f"Cancelled {len(active_jobs)} jobs")
 
-        workflow_uuid = os.getenv("workflow_uuid", "default")
+        self.progress.flush()
         self.publisher.publish_workflow_status(
-            workflow_uuid,
-            RunStatus.failed,
+            self.workflow_uuid,
+            RunStatus.failed.value,
             message="Snakemake is interrupted and all jobs are cancelled",
         )
 
+    def _cancel_job(self, job_info: SubmittedJobInfo) -> bool:
+        """Delete a job from job-controller, retrying transient failures.
+
+        Return whether the job is no longer running.
+        """
+        job_id = job_info.external_jobid
+        compute_backend = job_info.job.resources.get("compute_backend") or None
+        for attempt in range(1, CANCEL_JOBS_MAX_ATTEMPTS + 1):
+            try:
+                self.rjc_api_client._client.jobs.delete_job(
+                    job_id=job_id, compute_backend=compute_backend
+                ).result()
+                return True
+            except HTTPNotFound:
+                log.warning(f"Job {job_id} was not found in job-controller.")
+                return True
+            except HTTPClientError as exception:
+                log.error(f"Job {job_id} could not be cancelled: {exception}")
+                return False
+            except Exception as exception:
+                log.warning(
+                    f"Attempt {attempt} of {CANCEL_JOBS_MAX_ATTEMPTS} to cancel job "
+                    f"{job_id} failed: {exception}"
+                )
+                if attempt < CANCEL_JOBS_MAX_ATTEMPTS:
+                    time.sleep(CANCEL_JOBS_RETRY_DELAY_IN_SECONDS * attempt)
+        return False
+
+    def report_job_submission(
+        self, job_info: SubmittedJobInfo, register_job: bool = True
+    ):
+        """Override generic executor report_job_submission method."""
+        # Remember when the job was submitted to learn the runtime of its rule.
+        submitted_at = time.monotonic()
+        job_info.aux = dict(job_info.aux or {}, submitted_at=submitted_at)
+        ready_at = self.job_ready_at.pop(job_info.job, None)
+        if ready_at is not None:
+            self.metrics.job_wait_seconds.observe(submitted_at - ready_at)
+        super().report_job_submission(job_info, register_job=register_job)
+
+    def cancel(self):
+        """Override generic executor cancel method."""
+        # Wait for the submissions in flight, so that their jobs are cancelled
+        # too, and drop the ones that were not sent to job-controller yet.
+        with self.submissions_lock:
+            self.held_submissions.clear()
+        self.submission_pool.shutdown(wait=True, cancel_futures=True)
+        if self.local_job_pool is not None:
+            self.local_job_pool.shutdown(wait=True, cancel_futures=True)
+        super().cancel()
+
+    def shutdown(self):
+        """Override generic executor shutdown method."""
+        self.submission_pool.shutdown(wait=True)
+        if self.local_job_pool is not None:
+            self.local_job_pool.shutdown(wait=True)
+        super().shutdown()
+        self.progress.flush()
+        self.status_check_pool.shutdown(wait=False, cancel_futures=True)
+        if self.job_status_webhook is not None:
+            self.job_status_webhook.stop()
+        stats = self.http_adapter.connection_stats()
+        log.info(
+            f"Sent {stats['requests']} requests to job-controller "
+            f"over {stats['connections']} connections"
+        )
+        log.info(
+            "Mean latencies: "
+            + ", ".join(
+                f"{name} {seconds:.3f}s"
+                for name, seconds in summarise(self.metrics).items()
+            )
+        )
+        self._write_metrics_file(force=True)
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.journal is not None:
+            self.journal.close()
+        if self.checksums is not None:
+            log.info(
+                f"Input checksums: {self.checksums.hits} reused, "
+                f"{self.checksums.misses} computed"
+            )
+            self.checksums.close()
+
+    def get_python_executable(self) -> str:
+        """Get the Python interpreter running Snakemake inside job containers.
+
+        The engine's own interpreter is not available there.
+        """
+        return "python"
+
     @staticmethod
     def _build_job_name(job: JobExecutorInterface) -> str:
         """Build a descriptive job name including wildcards.
@@ -281,32 +668,32 @@ class Executor(RemoteExecutor):
     @staticmethod
     def _get_container_image(job: JobExecutorInterface) -> str:
         if job.container_img_url:
-            container_image = job.container_img_url.replace("docker://", "")
-            log.info(f"Environment: {container_image}")
-        else:
-            container_image = REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE
-            log.info(f"No environment specified, falling back to: {container_image}")
-        return container_image
+            return job.container_img_url.replace("docker://", "")
+        return REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE
 
     def _handle_job_status(
         self,
         job_id: str,
-        job_name: str,
+        job: JobExecutorInterface,
         job_status: JobStatus,
         workflow_status: RunStatus,
     ) -> None:
-        workflow_uuid = os.getenv("workflow_uuid", "default")
-        log.info(f"{job_name} job is {job_status.name}. job_id: {job_id}")
-        message = None
-        if job_id:
-            message = {
-                "progress": build_progress_message(
-                    **{job_status.name: {"total": 1, "job_ids": [job_id]}}
+        if job.is_group():
+            # Report each member of the group, as they all ran in one REANA job.
+            for member in self._get_group_members(job):
+                log.info(
+                    f"{self._build_job_name(member)} job is {job_status.name}. "
+                    f"job_id: {job_id}, group: {job.name}"
                 )
-            }
-        self.publisher.publish_workflow_status(
-            workflow_uuid, workflow_status.value, message=message
-        )
+        else:
+            log.info(f"{job.name} job is {job_status.name}. job_id: {job_id}")
+        if job_status == JobStatus.finished:
+            self.metrics.jobs_finished.inc()
+        else:
+            self.metrics.jobs_failed.inc()
+        if self.job_status_table is not None:
+            self.job_status_table.discard(job_id)
+        self.progress.job_status_changed(job_id, job_status, workflow_status)
 
     def _get_job_status_from_controller(self, job_id: str) -> str:
         """Get job status from controller.
@@ -314,7 +701,8 @@ class Executor(RemoteExecutor):
         If error occurs, return `failed` status.
         """
         try:
-            response = self.rjc_api_client.check_status(job_id)
+            with self.metrics.status_check_seconds.time():
+                response = self.rjc_api_client.check_status(job_id)
         except HTTPNotFound:
             log.error(
                 f"Job {job_id} was not found in job-controller. Return job failed status."
@@ -335,15 +723,509 @@ class Executor(RemoteExecutor):
             )
             return JobStatus.failed.name
 
-    def _submit_job(self, rjc_api_client, publisher, job_request_body):
-        """Submit job to REANA Job Controller."""
-        response = rjc_api_client.submit(**job_request_body)
+    def _get_jobs_status_from_controller(self) -> Dict[str, str]:
+        """Get the status of all jobs known to job-controller in one request.
+
+        Returns a mapping from job id to status. Jobs missing from the mapping
+        have to be checked one by one with ``_get_job_status_from_controller``.
+        If job-controller does not offer the bulk query or its answer cannot
+        be parsed, bulk polling is disabled for the rest of the workflow run.
+        Other errors only affect the current round. An empty mapping is
+        returned in both cases.
+        """
+        try:
+            with self.metrics.status_list_seconds.time():
+                future = self.rjc_api_client._client.jobs.get_jobs()
+                # Read the raw response: bravado would validate it against the
+                # spec, which describes a list of jobs while job-controller
+                # returns a ``{"jobs": {job_id: job}}`` dictionary.
+                response = future.future.result()
+            if response.status_code in (
+                HTTPStatus.NOT_FOUND,
+                HTTPStatus.METHOD_NOT_ALLOWED,
+            ):
+                log.warning(
+                    "job-controller does not support listing jobs, checking jobs "
+                    "one by one for the rest of the workflow run."
+                )
+                self.bulk_status_supported = False
+                return {}
+            response.raise_for_status()
+        except Exception as exception:
+            log.warning(
+                "Could not get the status of all jobs from job-controller, "
+                f"checking jobs one by one in this round. Details: {exception}"
+            )
+            return {}
+        try:
+            return self._parse_jobs_statuses(response.json())
+        except Exception as exception:
+            log.warning(
+                "Could not parse the job listing of job-controller, checking jobs "
+                f"one by one for the rest of the workflow run. Details: {exception}"
+            )
+            self.bulk_status_supported = False
+            return {}
+
+    @staticmethod
+    def _parse_jobs_statuses(response) -> Dict[str, str]:
+        """Build a job id to status mapping from a job-controller jobs listing.
+
+        The listing is either a list of jobs or, as returned by older
+        job-controller versions, a ``{"jobs": {job_id: job}}`` dictionary.
+        """
+        if isinstance(response, dict):
+            response = response.get("jobs", {})
+        if isinstance(response, dict):
+            response = [
+                dict(job, job_id=job.get("job_id", job_id))
+                for job_id, job in response.items()
+            ]
+
+        statuses = {}
+        for job in response:
+            if isinstance(job, dict):
+                job_id, status = job.get("job_id"), job.get("status")
+            else:
+                job_id = getattr(job, "job_id", None)
+                status = getattr(job, "status", None)
+            if job_id and status:
+                statuses[str(job_id)] = status
+        return statuses
+
+    def _build_job_request_body(
+        self, job: JobExecutorInterface, shellcmd: str, container_image: str
+    ) -> Dict:
+        """Build the job-controller request body of a shell job."""
+        return dict(
+            self._get_request_template(job, container_image),
+            cmd=f"cd {self.workflow_workspace} && {shellcmd}",
+            prettified_cmd=shellcmd,
+            job_name=self._build_job_name(job),
+            priority=self._get_priority(job),
+        )
+
+    def _build_snakemake_job_request_body(
+        self, job: JobExecutorInterface, container_image: str
+    ) -> Dict:
+        """Build the job-controller request body of a job run by Snakemake.
+
+        Snakemake runs the job inside its container, so the container image
+        has to provide a Snakemake version compatible with the engine's own.
+        The default environment image does not.
+        """
+        if container_image == REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE:
+            raise WorkflowError(
+                f"Job {job.name} is run by Snakemake, which requires a container "
+                f"image providing Snakemake {snakemake_version}. Set one with the "
+                f"container directive, the default {container_image} image "
+                "cannot run it."
+            )
+        return self._build_job_request_body(
+            job, self.format_job_exec(job), container_image
+        )
+
+    def _get_request_template(
+        self, job: JobExecutorInterface, container_image: str
+    ) -> Dict:
+        """Get the job request fields that do not change between the jobs of a rule.
+
+        They are resolved once for each rule, environment and set of resources,
+        as resources can depend on the wildcards of each job.
+        """
+        try:
+            key = (job.name, container_image, tuple(job.resources.items()))
+            template = self.request_templates.get(key)
+        except TypeError:
+            # Resources that cannot be hashed, resolved for every job.
+            key, template = None, None
+        if template is not None:
+            return template
+
+        if container_image != REANA_DEFAULT_SNAKEMAKE_ENV_IMAGE:
+            log.info(f"Environment of {job.name}: {container_image}")
+        else:
+            log.info(
+                f"No environment specified for {job.name}, "
+                f"falling back to: {container_image}"
+            )
+        resources = job.resources
+        template = {
+            "workflow_uuid": self.workflow_uuid,
+            "image": container_image,
+            "workflow_workspace": self.workflow_workspace,
+            "cvmfs_mounts": MOUNT_CVMFS,
+            "compute_backend": resources.get("compute_backend", ""),
+            "kerberos": resources.get("kerberos", WORKFLOW_KERBEROS),
+            "unpacked_img": resources.get("unpacked_img", False),
+            "kubernetes_uid": resources.get("kubernetes_uid"),
+            "kubernetes_cpu_request": resources.get("kubernetes_cpu_request"),
+            "kubernetes_cpu_limit": resources.get("kubernetes_cpu_limit"),
+            "kubernetes_memory_request": resources.get("kubernetes_memory_request"),
+            "kubernetes_memory_limit": resources.get("kubernetes_memory_limit"),
+            "kubernetes_job_timeout": resources.get("kubernetes_job_timeout"),
+            "voms_proxy": resources.get("voms_proxy", False),
+            "rucio": resources.get("rucio", False),
+            "htcondor_max_runtime": resources.get("htcondor_max_runtime", ""),
+            "htcondor_accounting_group": resources.get("htcondor_accounting_group", ""),
+            "slurm_partition": resources.get("slurm_partition"),
+            "slurm_time": resources.get("slurm_time"),
+            "c4p_cpu_cores": resources.get("c4p_cpu_cores"),
+            "c4p_memory_limit": resources.get("c4p_memory_limit"),
+            "c4p_additional_requirements": resources.get("c4p_additional_requirements"),
+        }
+        if key is not None:
+            self.request_templates[key] = template
+        return template
+
+    def _get_priority(self, job: JobExecutorInterface) -> int:
+        """Get the priority of a job, the higher the sooner it should run."""
+        if self.critical_path is None:
+            return 0
+        try:
+            return round(self.critical_path.get(job))
+        except Exception as exception:
+            log.warning(f"Could not compute priority of job {job.name}: {exception}")
+            return 0
+
+    def _build_group_job_request_body(self, job: JobExecutorInterface) -> Dict:
+        """Build the job-controller request body of a group job.
+
+        The shell commands of the jobs in the group are run one after the
+        other in dependency order inside a single container, stopping at the
+        first one that fails. Groups with jobs running Python code, or with
+        pipe or service outputs whose jobs have to run at the same time, are
+        run by Snakemake inside the container instead.
+        """
+        members = self._get_group_members(job)
+        container_images = {self._get_container_image(member) for member in members}
+        if len(container_images) > 1:
+            raise WorkflowError(
+                f"Group job {job.name} cannot run in a single container, its jobs "
+                f"use different environments: {', '.join(sorted(container_images))}"
+            )
+        if not all(
+            member.is_shell and not member.is_pipe and not member.is_service
+            for member in members
+        ):
+            return self._build_snakemake_job_request_body(job, container_images.pop())
+        shellcmd = " && ".join(f"({member.shellcmd})" for member in members)
+        return self._build_job_request_body(job, shellcmd, container_images.pop())
+
+    @staticmethod
+    def _get_group_members(job: JobExecutorInterface) -> List[JobExecutorInterface]:
+        """Get the jobs of a group that have to run, in dependency order."""
+        return [
+            member
+            for level in job.toposorted
+            for member in sorted(level)
+            if not member.is_norun
+        ]
+
+    @staticmethod
+    def _get_wildcards(job: JobExecutorInterface) -> Dict[str, str]:
+        """Get the wildcards of a job, group jobs having none."""
+        try:
+            return {key: str(value) for key, value in job.wildcards.items()}
+        except AttributeError:
+            return {}
+
+    def _resume_job(self, job: JobExecutorInterface, journal_key: str) -> bool:
+        """Reuse the REANA job run for ``job`` before the engine restarted.
+
+        Jobs that finished are accepted if their outputs exist and jobs that
+        job-controller still knows about are polled again, instead of being
+        resubmitted. Return whether the job was resumed.
+        """
+        entry = self.journal.get(journal_key)
+        if entry is None or entry.get("status") in (
+            JobStatus.failed.name,
+            JobStatus.stopped.name,
+        ):
+            return False
+        job_id = entry["job_id"]
+        job_info = SubmittedJobInfo(job=job, external_jobid=job_id)
+        if entry["status"] == JobStatus.finished.name:
+            if not all(os.path.exists(output) for output in job.output):
+                return False
+            log.info(
+                f"{job.name} job already finished before restart. job_id: {job_id}"
+            )
+            self.job_ready_at.pop(job, None)
+            self.progress.job_submitted(job_id)
+            self.report_job_success(job_info)
+            self._handle_job_status(
+                job_id,
+                job,
+                job_status=JobStatus.finished,
+                workflow_status=RunStatus.running,
+            )
+        else:
+            try:
+                with self.metrics.status_check_seconds.time():
+                    self.rjc_api_client.check_status(job_id)
+            except HTTPNotFound:
+                log.warning(
+                    f"{job.name} job submitted before restart is unknown to "
+                    f"job-controller, submitting it again. job_id: {job_id}"
+                )
+                return False
+            except Exception as exception:
+                # The status checks will tell whether the job is still there.
+                log.warning(
+                    f"Could not check {job.name} job submitted before restart. "
+                    f"job_id: {job_id}. Details: {exception}"
+                )
+            log.info(
+                f"Reattaching to {job.name} job submitted before restart. job_id: {job_id}"
+            )
+            self.progress.job_submitted(job_id)
+            with self.submissions_lock:
+                self.jobs_in_flight += 1
+            self.report_job_submission(job_info)
+        return True
+
+    def _queue_job_submission(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> None:
+        """Queue a job request for submission to job-controller."""
+        if self.journal is not None:
+            journal_key = build_job_key(
+                job.name,
+                self._get_wildcards(job),
+                job_request_body,
+                (str(path) for path in job.input),
+            )
+            if self._resume_job(job, journal_key):
+                return
+            self.journal_keys[job] = journal_key
+        if self.result_cache is not None and self._is_restorable(job):
+            # Hashing the inputs and copying the outputs would hold up the
+            # scheduler, so this is left to the submission workers.
+            self.submission_pool.submit(
+                self._restore_or_submit_job, job, job_request_body
+            )
+            return
+        self._hold_or_send_job_submission(job, job_request_body)
+
+    def _hold_or_send_job_submission(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> None:
+        """Hold a job request back for the concurrency limit, or send it."""
+        if self.concurrency is not None:
+            with self.submissions_lock:
+                heapq.heappush(
+                    self.held_submissions,
+                    (
+                        -job_request_body.get("priority", 0),
+                        next(self.held_submissions_order),
+                        job,
+                        job_request_body,
+                    ),
+                )
+            # Released by run_jobs once all the ready jobs have been received.
+            return
+        self._send_job_submission(job, job_request_body)
+
+    def _send_job_submission(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> None:
+        """Send a job request to job-controller."""
+        # Hand the request over to the submission workers, so that the
+        # scheduler can go on with the next ready job straight away.
+        self.submission_pool.submit(self._submit_and_report_job, job, job_request_body)
+
+    def _release_held_submissions(self) -> None:
+        """Send the held job requests for which there is room in flight."""
+        if self.concurrency is None:
+            return
+        released = []
+        with self.submissions_lock:
+            while (
+                self.held_submissions and self.jobs_in_flight < self.concurrency.current
+            ):
+                _, _, job, job_request_body = heapq.heappop(self.held_submissions)
+                released.append((job, job_request_body))
+                self.jobs_in_flight += 1
+            self.metrics.jobs_held.set(len(self.held_submissions))
+        for job, job_request_body in released:
+            self._send_job_submission(job, job_request_body)
+
+    def _job_left_flight(self, count: int = 1) -> None:
+        """Make room for held jobs after jobs are done or could not be submitted."""
+        if self.concurrency is None:
+            return
+        with self.submissions_lock:
+            self.jobs_in_flight = max(self.jobs_in_flight - count, 0)
+
+    def _runs_locally(self, job: JobExecutorInterface) -> bool:
+        """Whether a shell job is short enough to be run in the engine."""
+        if self.local_job_pool is None:
+            return False
+        runtime = job.resources.get("runtime")
+        return (
+            isinstance(runtime, (int, float))
+            and runtime <= LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES
+        )
+
+    def _run_and_report_local_job(self, job: JobExecutorInterface) -> None:
+        """Run a shell job in the engine and report its outcome.
+
+        Runs in one of the local job workers. The job is not known to
+        job-controller, so its output goes to the engine logs and only the
+        job counters of the workflow progress are updated.
+        """
+        try:
+            result = subprocess.run(
+                ["bash", "-c", job.shellcmd],
+                cwd=self.workflow_workspace,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+            output = result.stdout.strip()
+            if output:
+                log.info(f"{job.name} job output:\n{output}")
+            error = f"exit code {result.returncode}" if result.returncode else None
+        except OSError as exception:
+            error = str(exception)
+        if error is None:
+            log.info(f"{job.name} job is finished. Ran locally.")
+            self.metrics.jobs_finished.inc()
+            self.report_job_success(SubmittedJobInfo(job=job))
+            self.progress.job_status_changed(
+                None, JobStatus.finished, RunStatus.running
+            )
+        else:
+            log.error(f"{job.name} job is failed. Ran locally: {error}")
+            self.metrics.jobs_failed.inc()
+            self.report_job_error(SubmittedJobInfo(job=job))
+            self.progress.job_status_changed(None, JobStatus.failed, RunStatus.failed)
+
+    def _is_restorable(self, job: JobExecutorInterface) -> bool:
+        """Whether the outputs of a job can be kept in the result cache."""
+        # The command of jobs running Python code does not contain their code.
+        return (
+            not job.is_group()
+            and job.is_shell
+            and self.result_cache.is_cacheable([str(output) for output in job.output])
+        )
+
+    def _restore_or_submit_job(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> None:
+        """Restore the outputs of a job from the result cache, or submit it.
+
+        Runs in one of the submission workers.
+        """
+        try:
+            restored = self._restore_job_result(job, job_request_body)
+        except Exception as e:
+            log.warning(f"Could not restore {job.name} job outputs: {e}")
+            restored = False
+        if restored:
+            return
+        if self.concurrency is None:
+            self._submit_and_report_job(job, job_request_body)
+            return
+        self._hold_or_send_job_submission(job, job_request_body)
+        # run_jobs may have released the held jobs already.
+        self._release_held_submissions()
+
+    def _restore_job_result(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> bool:
+        """Restore the outputs of an identical job from the result cache.
+
+        Return whether the job was restored. Otherwise, its cache key is kept
+        to store its outputs once it finishes.
+        """
+        outputs = [str(output) for output in job.output]
+        result_key = self.result_cache.build_key(
+            job_request_body, (str(path) for path in job.input)
+        )
+        if result_key is None:
+            return False
+        if not self.result_cache.restore(result_key, outputs):
+            self.result_cache_keys[job] = result_key
+            return False
+        log.info(f"{job.name} job outputs restored from result cache.")
+        self.job_ready_at.pop(job, None)
+        self.journal_keys.pop(job, None)
+        self.metrics.result_cache_hits.inc()
+        self.metrics.jobs_finished.inc()
+        self.report_job_success(SubmittedJobInfo(job=job))
+        self.progress.job_status_changed(None, JobStatus.finished, RunStatus.running)
+        return True
+
+    def _store_result_and_report_success(
+        self, job_info: SubmittedJobInfo, result_key: str
+    ) -> None:
+        """Store the outputs of a finished job in the result cache and report it.
+
+        Runs in one of the submission workers. The job is only reported
+        finished once its outputs are copied, as Snakemake may remove them
+        afterwards, e.g. if they are temporary.
+        """
+        try:
+            self.result_cache.store(
+                result_key, [str(output) for output in job_info.job.output]
+            )
+        finally:
+            self._report_job_finished(job_info)
+
+    def _forget_job(self, job: JobExecutorInterface) -> None:
+        """Drop what is remembered about a job that could not be submitted."""
+        self.job_ready_at.pop(job, None)
+        self.journal_keys.pop(job, None)
+        self.result_cache_keys.pop(job, None)
+
+    def _record_job_submission(self, job: JobExecutorInterface, job_id: str) -> None:
+        """Record a submitted job in the restart journal, if enabled."""
+        journal_key = self.journal_keys.pop(job, None)
+        if self.journal is not None and journal_key is not None:
+            self.journal.record_submission(
+                journal_key, job_id, job.name, self._get_wildcards(job)
+            )
+
+    def _submit_and_report_job(
+        self, job: JobExecutorInterface, job_request_body: Dict
+    ) -> None:
+        """Submit job to REANA Job Controller and report it to Snakemake.
+
+        Runs in one of the submission workers. If the submission fails, the
+        job is reported as failed so that Snakemake does not wait for it.
+        """
+        submitted_at = time.monotonic()
+        try:
+            job_id = self._submit_job(job_request_body)
+        except Exception as e:
+            log.error(f"Error submitting job {job.name}: {e}")
+            self._forget_job(job)
+            self._job_left_flight()
+            if self.concurrency is not None:
+                self.concurrency.submission_failed()
+            self.report_job_error(SubmittedJobInfo(job=job))
+            return
+        if self.concurrency is not None:
+            self.concurrency.job_submitted(time.monotonic() - submitted_at)
+        self._record_job_submission(job, job_id)
+        self.report_job_submission(SubmittedJobInfo(job=job, external_jobid=job_id))
+
+    def _submit_job(self, job_request_body):
+        """Submit job to REANA Job Controller.
+
+        The job submission endpoint has no priority field, so the priority is
+        only used to order the jobs before they are submitted.
+        """
+        job_request_body = {
+            key: value for key, value in job_request_body.items() if key != "priority"
+        }
+        with self.metrics.submit_seconds.time():
+            response = self.rjc_api_client.submit(**job_request_body)
         job_id = str(response["job_id"])
+        self.metrics.jobs_submitted.inc()
 
         log.info(f"submitted job: {job_id}")
-        publish_job_submission(
-            workflow_uuid=job_request_body["workflow_uuid"],
-            publisher=publisher,
-            reana_job_id=job_id,
-        )
+        self.progress.job_submitted(job_id)
         return job_id
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake local HTTP endpoints."""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Type
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+class QuietRequestHandler(BaseHTTPRequestHandler):
+    """Request handler logging requests at debug level only."""
+
+    endpoint_name = "HTTP endpoint"
+    """Name of the endpoint in the request logs."""
+
+    def log_message(self, format, *args):
+        """Log requests at debug level only."""
+        log.debug(f"{self.endpoint_name}: {format % args}")
+
+
+class BackgroundHTTPServer:
+    """HTTP server handling requests in a background thread.
+
+    Subclasses attach the state their handler needs to ``self._server``, which
+    the handler reads as ``self.server``.
+    """
+
+    def __init__(
+        self,
+        handler_class: Type[BaseHTTPRequestHandler],
+        host: str,
+        port: int,
+        thread_name: str,
+    ):
+        """Create the server, listening on the given address."""
+        self._server = ThreadingHTTPServer((host, port), handler_class)
+        self._server.daemon_threads = True
+        self._thread_name = thread_name
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """Port the server is listening on."""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=self._thread_name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake pushed job status notifications."""
+
+import hmac
+import json
+import logging
+import threading
+from http import HTTPStatus
+from typing import Dict, Iterable
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE, JobStatus
+from reana_workflow_engine_snakemake.http_server import (
+    BackgroundHTTPServer,
+    QuietRequestHandler,
+)
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+class JobStatusTable:
+    """Thread-safe in-memory table of the last known status of each job."""
+
+    def __init__(self):
+        """Initialise an empty table."""
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, str] = {}
+
+    def update(self, job_id: str, status: str) -> None:
+        """Record the new status of a job."""
+        with self._lock:
+            self._statuses[job_id] = status
+
+    def get_many(self, job_ids: Iterable[str]) -> Dict[str, str]:
+        """Get the known statuses of the given jobs."""
+        with self._lock:
+            return {
+                job_id: self._statuses[job_id]
+                for job_id in job_ids
+                if job_id in self._statuses
+            }
+
+    def discard(self, job_id: str) -> None:
+        """Forget a job that is no longer active."""
+        with self._lock:
+            self._statuses.pop(job_id, None)
+
+
+class _JobStatusRequestHandler(QuietRequestHandler):
+    """Handle job status notifications sent to the webhook."""
+
+    endpoint_name = "Job status webhook"
+
+    def do_POST(self):
+        """Record the job status sent in the request body.
+
+        The body is a JSON object such as
+        ``{"job_id": "cdcf48b1-...", "status": "finished"}``, and the request
+        has to carry the shared token in an ``Authorization: Bearer`` header.
+        """
+        expected = f"Bearer {self.server.token}"
+        if not hmac.compare_digest(
+            self.headers.get("Authorization", "").encode(), expected.encode()
+        ):
+            self.send_error(HTTPStatus.UNAUTHORIZED)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            notification = json.loads(self.rfile.read(length))
+            job_id = str(notification["job_id"])
+            status = notification["status"]
+            if status not in JobStatus.__members__:
+                raise ValueError(f"unknown job status {status}")
+        except (KeyError, TypeError, ValueError) as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self.server.job_status_table.update(job_id, status)
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.end_headers()
+
+
+class JobStatusWebhook(BackgroundHTTPServer):
+    """Local HTTP endpoint receiving job status transitions.
+
+    Every notification updates ``table``, which the executor reads without
+    any request to job-controller. Notifications are only accepted from
+    senders knowing ``token``.
+    """
+
+    def __init__(
+        self,
+        table: JobStatusTable,
+        token: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Create the webhook server, listening on the given address."""
+        if not token:
+            raise ValueError("The job status webhook requires a token.")
+        super().__init__(
+            _JobStatusRequestHandler, host, port, "reana-job-status-webhook"
+        )
+        self.table = table
+        self._server.job_status_table = table
+        self._server.token = token
+
+    def start(self) -> None:
+        """Start serving notifications in a background thread."""
+        super().start()
+        log.info(f"Listening for job status notifications on port {self.port}")
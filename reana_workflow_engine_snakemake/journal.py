@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake restart journal."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+_SNAKEMAKE_TMPDIR = re.compile(r"[^\s'\"]*\.snakemake/tmp\.[^/\s'\"]+")
+"""Temporary directory created by each Snakemake run, as found in job commands."""
+
+
+def build_job_key(
+    rule: str, wildcards: Dict[str, str], job_request_body: Dict, inputs: Iterable[str]
+) -> str:
+    """Build the key identifying a job across restarts of the workflow run.
+
+    The key changes whenever the command, the environment or the inputs of
+    the job change, so that a job is only reused if it would run the same.
+    The temporary directory of the Snakemake run, which differs after every
+    restart, is left out of the command.
+    """
+
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    identity = {
+        "rule": rule,
+        "wildcards": wildcards,
+        "image": job_request_body.get("image"),
+        "cmd": _SNAKEMAKE_TMPDIR.sub("", job_request_body.get("cmd") or ""),
+        "inputs": [[path, _stat(path)] for path in sorted(inputs)],
+    }
+    return hashlib.sha256(
+        json.dumps(identity, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class JobJournal:
+    """Append-only journal of the REANA jobs of a workflow run.
+
+    Every submitted job and every change of its status is appended to a
+    JSON-lines file in the workspace, so that the run can reattach to its
+    jobs after the engine is restarted instead of submitting them again.
+    """
+
+    def __init__(self, path: str):
+        """Open the journal at ``path``, loading the jobs of previous runs."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self.entries: Dict[str, Dict] = {}
+        self._keys_by_job_id: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load the last known state of every job in the journal."""
+        try:
+            with open(self.path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+                key = record["key"]
+            except (ValueError, KeyError, TypeError):
+                # The engine may have stopped in the middle of a write.
+                continue
+            self.entries[key] = {**self.entries.get(key, {}), **record}
+            self._keys_by_job_id[record["job_id"]] = key
+        log.info(f"Loaded {len(self.entries)} jobs from restart journal {self.path}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get the last known state of a job."""
+        with self._lock:
+            return self.entries.get(key)
+
+    def record_submission(
+        self, key: str, job_id: str, rule: str, wildcards: Dict[str, str]
+    ) -> None:
+        """Record the submission of a job to job-controller."""
+        self._append(
+            {
+                "key": key,
+                "job_id": job_id,
+                "rule": rule,
+                "wildcards": wildcards,
+                "status": "created",
+            }
+        )
+
+    def update_status(self, job_id: str, status: str) -> None:
+        """Record the status of a job, if it changed."""
+        with self._lock:
+            key = self._keys_by_job_id.get(job_id)
+            if key is None or self.entries[key].get("status") == status:
+                return
+        self._append({"key": key, "job_id": job_id, "status": status})
+
+    def _append(self, record: Dict) -> None:
+        """Append a record to the journal."""
+        with self._lock:
+            key = record["key"]
+            self.entries[key] = {**self.entries.get(key, {}), **record}
+            self._keys_by_job_id[record["job_id"]] = key
+            try:
+                if self._file is None:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    self._file = open(self.path, "a")
+                self._file.write(json.dumps(record) + "\n")
+                self._file.flush()
+            except OSError as exception:
+                log.warning(f"Could not write to restart journal: {exception}")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def remove(path: str) -> None:
+        """Remove the journal of a workflow run that completed."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
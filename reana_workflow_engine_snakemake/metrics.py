@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake executor metrics.
+
+Metrics are exposed in the Prometheus text format, either on a local HTTP
+endpoint or in a file in the workflow workspace.
+"""
+
+import abc
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http import HTTPStatus
+from typing import Dict, List, Optional, Sequence
+
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+from reana_workflow_engine_snakemake.http_server import (
+    BackgroundHTTPServer,
+    QuietRequestHandler,
+)
+
+log = logging.getLogger(LOGGING_MODULE)
+
+METRICS_PREFIX = "reana_snakemake_"
+"""Prefix of the names of all the executor metrics."""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+"""Default histogram buckets, in seconds."""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as expected by the Prometheus text format."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(abc.ABC):
+    """Metric with a name and a help text."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = METRICS_PREFIX + name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Get the sample lines of the metric."""
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        return "\n".join(lines + self.samples())
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        """Initialise the counter at zero."""
+        super().__init__(name, documentation)
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter by ``amount``."""
+        with self._lock:
+            self.value += amount
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the counter."""
+        return [f"{self.name} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        """Initialise the gauge at zero."""
+        super().__init__(name, documentation)
+        self.value = 0
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        with self._lock:
+            self.value = value
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the gauge."""
+        return [f"{self.name} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution of durations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """Initialise an empty histogram with the given bucket upper bounds."""
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    self._counts[i] += 1
+                    break
+
+    @contextmanager
+    def time(self):
+        """Observe the time spent in the ``with`` block."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started)
+
+    def samples(self) -> List[str]:
+        """Get the bucket, sum and count sample lines of the histogram."""
+        with self._lock:
+            counts, total, count = list(self._counts), self.sum, self.count
+        lines = []
+        cumulated = 0
+        for upper_bound, bucket_count in zip(self.buckets, counts):
+            cumulated += bucket_count
+            lines.append(
+                f'{self.name}_bucket{{le="{_format_value(upper_bound)}"}} {cumulated}'
+            )
+        lines.append(f"{self.name}_sum {_format_value(total)}")
+        lines.append(f"{self.name}_count {count}")
+        return lines
+
+
+class ExecutorMetrics:
+    """Metrics of the hot paths of the executor."""
+
+    def __init__(self):
+        """Create all the executor metrics."""
+        self.submit_seconds = Histogram(
+            "job_submit_seconds", "Time taken by job-controller to accept a job."
+        )
+        self.jobs_submitted = Counter(
+            "jobs_submitted_total", "Jobs submitted to job-controller."
+        )
+        self.job_wait_seconds = Histogram(
+            "job_ready_to_submitted_seconds",
+            "Time from a job being ready to it being submitted to job-controller.",
+        )
+        self.status_check_seconds = Histogram(
+            "job_status_check_seconds",
+            "Time taken by job-controller to return the status of one job.",
+        )
+        self.status_list_seconds = Histogram(
+            "jobs_status_list_seconds",
+            "Time taken by job-controller to return the status of all jobs.",
+        )
+        self.poll_round_seconds = Histogram(
+            "poll_round_seconds", "Time taken to check the status of all active jobs."
+        )
+        self.active_jobs = Gauge("active_jobs", "Jobs submitted and not finished yet.")
+        self.concurrency_limit = Gauge(
+            "concurrency_limit", "Jobs allowed to be submitted and not finished yet."
+        )
+        self.jobs_held = Gauge(
+            "jobs_held", "Jobs ready but held back by the concurrency limit."
+        )
+        self.jobs_finished = Counter("jobs_finished_total", "Jobs that finished.")
+        self.jobs_failed = Counter("jobs_failed_total", "Jobs that failed.")
+        self.result_cache_hits = Counter(
+            "result_cache_hits_total", "Jobs whose outputs were restored from cache."
+        )
+        self.mq_publish_seconds = Histogram(
+            "mq_publish_seconds", "Time taken to publish a workflow status to MQ."
+        )
+        self.mq_published = Counter(
+            "mq_messages_published_total", "Workflow status messages published to MQ."
+        )
+
+    def all(self) -> List[_Metric]:
+        """Get all the metrics."""
+        return [metric for metric in vars(self).values() if isinstance(metric, _Metric)]
+
+    def render(self) -> str:
+        """Render all the metrics in the Prometheus text format."""
+        return "\n".join(metric.render() for metric in self.all()) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write all the metrics to ``path``, replacing it atomically."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+
+class InstrumentedPublisher:
+    """Workflow status publisher recording how many messages it sends and how fast."""
+
+    def __init__(self, publisher, metrics: ExecutorMetrics):
+        """Wrap ``publisher``, recording its activity in ``metrics``."""
+        self._publisher = publisher
+        self._metrics = metrics
+
+    def publish_workflow_status(self, *args, **kwargs):
+        """Publish a workflow status to MQ."""
+        with self._metrics.mq_publish_seconds.time():
+            result = self._publisher.publish_workflow_status(*args, **kwargs)
+        self._metrics.mq_published.inc()
+        return result
+
+    def __getattr__(self, name):
+        """Delegate everything else to the wrapped publisher."""
+        return getattr(self._publisher, name)
+
+
+class _MetricsRequestHandler(QuietRequestHandler):
+    """Serve the executor metrics."""
+
+    endpoint_name = "Metrics endpoint"
+
+    def do_GET(self):
+        """Send the metrics in the Prometheus text format."""
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body = self.server.metrics.render().encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer(BackgroundHTTPServer):
+    """Local HTTP endpoint exposing the executor metrics on ``/metrics``."""
+
+    def __init__(
+        self, metrics: ExecutorMetrics, host: str = "127.0.0.1", port: int = 0
+    ):
+        """Create the metrics server, listening on the given address."""
+        super().__init__(_MetricsRequestHandler, host, port, "reana-metrics")
+        self.metrics = metrics
+        self._server.metrics = metrics
+
+    def start(self) -> None:
+        """Start serving metrics in a background thread."""
+        super().start()
+        log.info(f"Serving metrics on port {self.port}")
+
+
+def summarise(metrics: ExecutorMetrics) -> Dict[str, float]:
+    """Get the mean of the main executor latencies, in seconds."""
+    return {
+        histogram.name[len(METRICS_PREFIX) :]: (
+            histogram.sum / histogram.count if histogram.count else 0.0
+        )
+        for histogram in metrics.all()
+        if isinstance(histogram, Histogram)
+    }
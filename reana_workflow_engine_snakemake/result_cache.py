@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job result cache."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from reana_workflow_engine_snakemake.checksum import ChecksumService
+from reana_workflow_engine_snakemake.config import LOGGING_MODULE
+
+log = logging.getLogger(LOGGING_MODULE)
+
+RESULT_CACHE_KEY_FIELDS = (
+    "prettified_cmd",
+    "image",
+    "cvmfs_mounts",
+    "compute_backend",
+    "kerberos",
+    "unpacked_img",
+    "voms_proxy",
+    "rucio",
+)
+"""Fields of a job request body that can change the outputs of a job."""
+
+
+class ResultCache:
+    """Content-addressed cache of the outputs of jobs run by previous workflow runs.
+
+    A job is identified by everything its outputs depend on: its command, its
+    container image, the resources changing its environment and the checksums
+    of its inputs. The outputs of a job that finished are copied into an entry
+    named after this key, from which they are copied back into the workspace
+    when an identical job is run again, instead of submitting it.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        workflow_workspace: str,
+        checksums: Optional[ChecksumService] = None,
+    ):
+        """Initialise the cache of the jobs run in ``workflow_workspace``."""
+        self.cache_dir = cache_dir
+        self.workflow_workspace = os.path.abspath(workflow_workspace)
+        self.checksums = checksums or ChecksumService()
+
+    def build_key(self, job_request_body: Dict, inputs: Iterable[str]) -> Optional[str]:
+        """Build the cache key of a job.
+
+        Return ``None`` if the key cannot be built, e.g. because an input is
+        missing.
+        """
+        try:
+            checksums = self.checksums.checksums(inputs)
+        except OSError:
+            return None
+        identity = {
+            "request": {
+                field: job_request_body.get(field) for field in RESULT_CACHE_KEY_FIELDS
+            },
+            "inputs": sorted(
+                [self._relative_path(path), checksum]
+                for path, checksum in checksums.items()
+            ),
+        }
+        return hashlib.sha256(
+            json.dumps(identity, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _relative_path(self, path: str) -> str:
+        """Get the path of a file relative to the workspace."""
+        return os.path.relpath(os.path.abspath(path), self.workflow_workspace)
+
+    def _entry_dir(self, key: str) -> str:
+        """Get the directory of a cache entry."""
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def is_cacheable(self, outputs: List[str]) -> bool:
+        """Whether the outputs of a job can be stored in the cache.
+
+        Jobs without outputs are run for their side effects, and outputs
+        outside the workspace cannot be restored safely.
+        """
+        return bool(outputs) and all(
+            not self._relative_path(output).startswith(os.pardir) for output in outputs
+        )
+
+    def restore(self, key: str, outputs: List[str]) -> bool:
+        """Copy the outputs of a cached job into the workspace.
+
+        Return whether the job was found in the cache and all its outputs
+        were restored.
+        """
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, "entry.json")) as f:
+                cached_outputs = json.load(f)["outputs"]
+        except (OSError, ValueError, KeyError):
+            return False
+        relative_outputs = [self._relative_path(output) for output in outputs]
+        if sorted(cached_outputs) != sorted(relative_outputs):
+            return False
+        try:
+            for output, relative_output in zip(outputs, relative_outputs):
+                self._copy(os.path.join(entry_dir, "outputs", relative_output), output)
+        except OSError as exception:
+            log.warning(f"Could not restore job outputs from cache: {exception}")
+            return False
+        return True
+
+    def store(self, key: str, outputs: List[str]) -> None:
+        """Copy the outputs of a finished job into the cache."""
+        entry_dir = self._entry_dir(key)
+        if os.path.exists(entry_dir):
+            return
+        # Written next to the entry and renamed, so that a partial copy is
+        # never restored.
+        tmp_dir = f"{entry_dir}.{uuid.uuid4().hex}.tmp"
+        relative_outputs = [self._relative_path(output) for output in outputs]
+        try:
+            for output, relative_output in zip(outputs, relative_outputs):
+                self._copy(output, os.path.join(tmp_dir, "outputs", relative_output))
+            with open(os.path.join(tmp_dir, "entry.json"), "w") as f:
+                json.dump({"outputs": relative_outputs}, f)
+            os.rename(tmp_dir, entry_dir)
+        except OSError as exception:
+            if not os.path.exists(entry_dir):
+                log.warning(f"Could not store job outputs in cache: {exception}")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _copy(source: str, destination: str) -> None:
+        """Copy a file or directory, giving the copy a new modification time.
+
+        Snakemake would otherwise consider restored outputs older than their
+        inputs.
+        """
+        os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+        if os.path.isdir(source):
+            shutil.rmtree(destination, ignore_errors=True)
+            shutil.copytree(source, destination, copy_function=shutil.copy)
+        else:
+            shutil.copy(source, destination)
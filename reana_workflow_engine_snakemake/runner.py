@@ -8,9 +8,13 @@
 
 """REANA-Workflow-Engine-Snakemake runner."""
 
+import json
 import os
 import logging
+import queue
 import re
+import shutil
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from snakemake.api import SnakemakeApi
@@ -40,11 +44,23 @@ from reana_commons.config import REANA_LOG_FORMAT
 
 from reana_workflow_engine_snakemake.config import (
     LOGGING_MODULE,
+    REPORT_REQUEST_FILE,
+    RESTART_JOURNAL,
+    RESTART_JOURNAL_FILE,
+    SNAKEMAKE_LOG_FORMAT,
+    SNAKEMAKE_LOG_FORMATS,
+    SNAKEMAKE_LOG_QUEUE_SIZE,
+    SNAKEMAKE_LOG_SAMPLE_RATE,
+    SNAKEMAKE_LOG_SAMPLED_EVENTS,
     SNAKEMAKE_MAX_PARALLEL_JOBS,
+    SNAKEMAKE_REPORT_MODE,
+    SNAKEMAKE_REPORT_MODES,
     DEFAULT_SNAKEMAKE_REPORT_FILENAME,
+    DEFAULT_SNAKEMAKE_REPORT_MODE,
 )
 
 from reana_workflow_engine_snakemake import executor as reana_executor
+from reana_workflow_engine_snakemake.journal import JobJournal
 
 log = logging.getLogger(LOGGING_MODULE)
 
@@ -65,19 +81,109 @@ class SnakemakeLoggingFormatter(logging.Formatter):
         super().__init__(fmt=REANA_LOG_FORMAT)
         self._snakemake_formatter = DefaultFormatter(quiet=set())
 
-    def format(self, record):
-        """Format a log record."""
+    def _format_body(self, record):
+        """Format the message body of a log record, empty if to be suppressed."""
         body = self._snakemake_formatter.format(record)
         if not body or body == "None":
             return ""
         # Strip Snakemake's own timestamp (e.g. "[Mon Mar  2 11:19:30 2026]\n")
         # since REANA_LOG_FORMAT already provides one.
-        body = self._SNAKEMAKE_TIMESTAMP_RE.sub("", body)
+        return self._SNAKEMAKE_TIMESTAMP_RE.sub("", body)
+
+    def format(self, record):
+        """Format a log record."""
+        body = self._format_body(record)
+        if not body:
+            return ""
         record.msg = body
         record.args = None
         return super().format(record)
 
 
+class SnakemakeJSONFormatter(SnakemakeLoggingFormatter):
+    """Format Snakemake log records as JSON lines, for log collectors."""
+
+    _JOB_FIELDS = ("jobid", "rule_name")
+
+    def format(self, record):
+        """Format a log record."""
+        body = self._format_body(record)
+        if not body:
+            return ""
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "event": getattr(record, "event", None),
+            "message": body,
+        }
+        for field in self._JOB_FIELDS:
+            if getattr(record, field, None) is not None:
+                entry[field] = getattr(record, field)
+        return json.dumps(entry, default=str)
+
+
+class SnakemakeLogSampler(logging.Filter):
+    """Keep only one of every ``sample_rate`` records of high-volume events.
+
+    A rate of zero drops these records altogether. Warnings and errors are
+    always kept.
+    """
+
+    def __init__(self, sample_rate, events):
+        """Initialise the sampler of the given Snakemake log events."""
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.events = set(events)
+        self._counts = {}
+
+    def filter(self, record):
+        """Whether to keep a log record."""
+        event = getattr(record, "event", None)
+        if event not in self.events or record.levelno >= logging.WARNING:
+            return True
+        if self.sample_rate <= 0:
+            return False
+        count = self._counts.get(event, 0)
+        self._counts[event] = count + 1
+        return count % self.sample_rate == 0
+
+
+class SnakemakeLogQueueHandler(QueueHandler):
+    """Hand Snakemake log records over to the logging thread.
+
+    Records are formatted by the logging thread rather than by the thread
+    logging them. Records below ``WARNING`` are dropped if the queue is full,
+    while warnings and errors wait for room in the queue.
+    """
+
+    def __init__(self, log_queue):
+        """Initialise the handler writing to ``log_queue``."""
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        """Pass the record unchanged, as it does not leave the process."""
+        return record
+
+    def enqueue(self, record):
+        """Queue a record, dropping it if the queue is full and it is not a warning."""
+        if record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SnakemakeLogListener(QueueListener):
+    """Write the queued Snakemake log records from a separate thread."""
+
+    def enqueue_sentinel(self):
+        """Wait for room in the queue to ask the thread to stop."""
+        self.queue.put(self._sentinel)
+
+
 def _setup_snakemake_logging(printshellcmds=True):
     """Replace Snakemake's default logging handlers with a REANA-friendly one.
 
@@ -90,17 +196,31 @@ def _setup_snakemake_logging(printshellcmds=True):
       messages no longer bubble up to the root logger (eliminates duplicate
       and broken ``"None"`` lines);
     * removes all existing handlers;
-    * adds a single ``StreamHandler`` with ``SnakemakeLoggingFormatter`` and
-      Snakemake's ``DefaultFilter``.
+    * adds a single ``SnakemakeLogQueueHandler``, with Snakemake's
+      ``DefaultFilter`` and a ``SnakemakeLogSampler``, so that the scheduler
+      only waits for log output to write warnings and errors;
+    * starts a ``SnakemakeLogListener`` writing the records to a
+      ``StreamHandler`` with ``SnakemakeLoggingFormatter``, or
+      ``SnakemakeJSONFormatter`` in the ``json`` log format.
+
+    Returns the started listener, to be stopped with
+    ``_stop_snakemake_logging``.
     """
     snakemake_logger.propagate = False
 
     for handler in snakemake_logger.handlers[:]:
         snakemake_logger.removeHandler(handler)
 
+    if SNAKEMAKE_LOG_FORMAT not in SNAKEMAKE_LOG_FORMATS:
+        log.warning(f"Unknown Snakemake log format {SNAKEMAKE_LOG_FORMAT}, using text.")
     handler = logging.StreamHandler()
-    handler.setFormatter(SnakemakeLoggingFormatter())
-    handler.addFilter(
+    handler.setFormatter(
+        SnakemakeJSONFormatter()
+        if SNAKEMAKE_LOG_FORMAT == "json"
+        else SnakemakeLoggingFormatter()
+    )
+    queue_handler = SnakemakeLogQueueHandler(queue.Queue(SNAKEMAKE_LOG_QUEUE_SIZE))
+    queue_handler.addFilter(
         DefaultFilter(
             quiet=set(),
             debug_dag=False,
@@ -108,7 +228,35 @@ def _setup_snakemake_logging(printshellcmds=True):
             printshellcmds=printshellcmds,
         )
     )
-    snakemake_logger.addHandler(handler)
+    if SNAKEMAKE_LOG_SAMPLE_RATE != 1:
+        queue_handler.addFilter(
+            SnakemakeLogSampler(SNAKEMAKE_LOG_SAMPLE_RATE, SNAKEMAKE_LOG_SAMPLED_EVENTS)
+        )
+    snakemake_logger.addHandler(queue_handler)
+    listener = SnakemakeLogListener(queue_handler.queue, handler)
+    listener.start()
+    return listener
+
+
+def _stop_snakemake_logging(listener):
+    """Write the queued Snakemake log records and stop the logging thread.
+
+    Records logged afterwards, e.g. while Snakemake cleans up, are written
+    directly by the thread logging them.
+    """
+    listener.stop()
+    for queue_handler in snakemake_logger.handlers[:]:
+        if not isinstance(queue_handler, SnakemakeLogQueueHandler):
+            continue
+        snakemake_logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            handler.filters = queue_handler.filters
+            snakemake_logger.addHandler(handler)
+        if queue_handler.dropped:
+            log.warning(
+                f"{queue_handler.dropped} Snakemake log records were dropped "
+                "because the log queue was full."
+            )
 
 
 my_registry = ExecutorPluginRegistry()
@@ -131,46 +279,155 @@ def _generate_report(dag_api, workflow_workspace, report_file_name):
     dag_api.create_report(reporter="html", report_settings=report_settings)
 
 
+def _remove_stale_locks(workflow_workspace):
+    """Remove the Snakemake locks left behind by an engine that was stopped.
+
+    Equivalent to ``snakemake --unlock``, without building the DAG.
+    """
+    shutil.rmtree(
+        os.path.join(workflow_workspace, ".snakemake", "locks"), ignore_errors=True
+    )
+
+
+def _get_report_mode(operational_options):
+    """Get when to generate the report of the workflow run."""
+    report_mode = operational_options.get("report_mode", SNAKEMAKE_REPORT_MODE)
+    if report_mode not in SNAKEMAKE_REPORT_MODES:
+        log.warning(
+            f"Unknown report mode {report_mode}, "
+            f"using {DEFAULT_SNAKEMAKE_REPORT_MODE} instead."
+        )
+        return DEFAULT_SNAKEMAKE_REPORT_MODE
+    return report_mode
+
+
+def _create_workflow_api(
+    snakemake_api, workflow_workspace, workflow_file, workflow_parameters
+):
+    """Load the workflow to run."""
+    return snakemake_api.workflow(
+        resource_settings=ResourceSettings(nodes=SNAKEMAKE_MAX_PARALLEL_JOBS),
+        config_settings=ConfigSettings(config=workflow_parameters),
+        storage_settings=StorageSettings(),
+        storage_provider_settings=dict(),
+        workflow_settings=WorkflowSettings(),
+        deployment_settings=DeploymentSettings(),
+        snakefile=Path(os.path.join(workflow_workspace, workflow_file)),
+        workdir=Path(workflow_workspace),
+    )
+
+
 def run_jobs(
     workflow_workspace,
     workflow_file,
     workflow_parameters,
     operational_options={},
 ):
-    """Run Snakemake jobs using custom REANA executor."""
-    workflow_file_path = os.path.join(workflow_workspace, workflow_file)
+    """Run Snakemake jobs using custom REANA executor.
+
+    The report is generated as well, unless the report mode is ``lazy``, in
+    which case it is left to ``generate_report``, or ``off``.
+    """
     printshellcmds = True
+    journal_path = os.path.join(workflow_workspace, RESTART_JOURNAL_FILE)
+    # The outputs of the jobs that were running when the engine stopped are
+    # marked as incomplete. Let Snakemake schedule these jobs again, the
+    # executor then reattaches to them instead of submitting them again.
+    resuming = RESTART_JOURNAL and os.path.exists(journal_path)
+    if resuming:
+        log.info(f"Resuming workflow run with the jobs in {journal_path}")
+        _remove_stale_locks(workflow_workspace)
     with SnakemakeApi(
         OutputSettings(
             printshellcmds=printshellcmds,
         )
     ) as snakemake_api:
-        _setup_snakemake_logging(printshellcmds=printshellcmds)
+        log_listener = _setup_snakemake_logging(printshellcmds=printshellcmds)
         try:
-            workflow_api = snakemake_api.workflow(
-                resource_settings=ResourceSettings(nodes=SNAKEMAKE_MAX_PARALLEL_JOBS),
-                config_settings=ConfigSettings(config=workflow_parameters),
-                storage_settings=StorageSettings(),
-                storage_provider_settings=dict(),
-                workflow_settings=WorkflowSettings(),
-                deployment_settings=DeploymentSettings(),
-                snakefile=Path(workflow_file_path),
-                workdir=Path(workflow_workspace),
+            workflow_api = _create_workflow_api(
+                snakemake_api, workflow_workspace, workflow_file, workflow_parameters
             )
             dag_api = workflow_api.dag(
-                dag_settings=DAGSettings(),
+                dag_settings=DAGSettings(force_incomplete=resuming),
             )
 
             dag_api.execute_workflow(
                 executor="reana",
             )
+            JobJournal.remove(journal_path)
 
+            report_mode = _get_report_mode(operational_options)
             report_file_name = operational_options.get(
                 "report", DEFAULT_SNAKEMAKE_REPORT_FILENAME
             )
-            _generate_report(dag_api, workflow_workspace, report_file_name)
+            if report_mode == "sync":
+                _generate_report(dag_api, workflow_workspace, report_file_name)
+            elif report_mode == "lazy":
+                _save_report_request(
+                    workflow_workspace,
+                    workflow_file,
+                    workflow_parameters,
+                    report_file_name,
+                )
             return True
 
         except WorkflowError as e:
             snakemake_api.print_exception(e)
             return False
+        finally:
+            _stop_snakemake_logging(log_listener)
+
+
+def _save_report_request(
+    workflow_workspace, workflow_file, workflow_parameters, report_file_name
+):
+    """Record what ``generate_report`` needs to build the report later."""
+    request_path = os.path.join(workflow_workspace, REPORT_REQUEST_FILE)
+    os.makedirs(os.path.dirname(request_path), exist_ok=True)
+    with open(request_path, "w") as f:
+        json.dump(
+            {
+                "workflow_file": workflow_file,
+                "workflow_parameters": workflow_parameters,
+                "report": report_file_name,
+            },
+            f,
+        )
+    log.info(
+        "Snakemake report left to generate with "
+        f"generate-snakemake-report {workflow_workspace}"
+    )
+
+
+def generate_report(workflow_workspace):
+    """Generate the report of a workflow run in the ``lazy`` report mode.
+
+    Meant to run once the workflow is reported finished and the engine is
+    gone, for instance in an interactive session or a follow-up job on the
+    same workspace. Return whether the report was generated.
+    """
+    request_path = os.path.join(workflow_workspace, REPORT_REQUEST_FILE)
+    try:
+        with open(request_path) as f:
+            request = json.load(f)
+    except (OSError, ValueError) as e:
+        log.error(f"No Snakemake report to generate in {workflow_workspace}: {e}")
+        return False
+    with SnakemakeApi(OutputSettings()) as snakemake_api:
+        log_listener = _setup_snakemake_logging()
+        try:
+            workflow_api = _create_workflow_api(
+                snakemake_api,
+                workflow_workspace,
+                request["workflow_file"],
+                request["workflow_parameters"],
+            )
+            dag_api = workflow_api.dag(dag_settings=DAGSettings())
+            _generate_report(dag_api, workflow_workspace, request["report"])
+        except WorkflowError as e:
+            snakemake_api.print_exception(e)
+            return False
+        finally:
+            _stop_snakemake_logging(log_listener)
+    os.remove(request_path)
+    return True
@@ -8,18 +8,74 @@
 
 """REANA-Workflow-Engine-Snakemake utilities."""
 
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
 from reana_commons.publisher import WorkflowStatusPublisher
 from reana_commons.utils import build_progress_message
-from snakemake.jobs import Job
+
+from reana_workflow_engine_snakemake.config import (
+    ADAPTIVE_CONCURRENCY_DECREASE_INTERVAL_IN_SECONDS,
+    ADAPTIVE_CONCURRENCY_INITIAL,
+    ADAPTIVE_CONCURRENCY_MIN,
+    ADAPTIVE_CONCURRENCY_QUEUED_RATIO,
+    ADAPTIVE_CONCURRENCY_SUBMIT_LATENCY_IN_SECONDS,
+    LOGGING_MODULE,
+    POLL_JOBS_STATUS_MAX_SLEEP_IN_SECONDS,
+    POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+    POLL_JOBS_STATUS_SLEEP_IN_SECONDS,
+    PROGRESS_PUBLISH_BATCH_SIZE,
+    PROGRESS_PUBLISH_INTERVAL_IN_SECONDS,
+    SNAKEMAKE_MAX_PARALLEL_JOBS,
+    JobStatus,
+    RunStatus,
+)
+
+if TYPE_CHECKING:
+    # Snakemake is slow to import and not needed to report the workflow start.
+    from snakemake.jobs import Job
+
+log = logging.getLogger(LOGGING_MODULE)
+
+
+class WorkflowIdentity(NamedTuple):
+    """Workflow run the engine is running the jobs of."""
+
+    uuid: str
+    workspace: str
+
+
+_workflow_identity: Optional[WorkflowIdentity] = None
+
+
+def set_workflow_identity(workflow_uuid: str, workflow_workspace: str) -> None:
+    """Set the workflow run the engine is running the jobs of."""
+    global _workflow_identity
+    _workflow_identity = WorkflowIdentity(workflow_uuid, workflow_workspace)
+
+
+def get_workflow_identity() -> WorkflowIdentity:
+    """Get the workflow run the engine is running the jobs of.
+
+    Falls back to the ``workflow_uuid`` and ``workflow_workspace`` environment
+    variables when the engine was not started from the command line.
+    """
+    if _workflow_identity is not None:
+        return _workflow_identity
+    return WorkflowIdentity(
+        os.getenv("workflow_uuid", "default"),
+        os.getenv("workflow_workspace", "default"),
+    )
 
 
 def publish_workflow_start(
-    workflow_uuid: str, publisher: WorkflowStatusPublisher, job: Job
+    workflow_uuid: str, publisher: WorkflowStatusPublisher, job_count: int
 ):
     """Publish to MQ the start of the workflow."""
-    job_count = len(
-        [j for j in (job.dag._needrun | job.dag._finished) if not j.rule.norun]
-    )
     total_jobs = {"total": job_count, "job_ids": []}
     status_running = 1
     publisher.publish_workflow_status(
@@ -29,14 +85,351 @@ def publish_workflow_start(
     )
 
 
-def publish_job_submission(
-    workflow_uuid: str, publisher: WorkflowStatusPublisher, reana_job_id: str
+def publish_jobs_progress(
+    workflow_uuid: str,
+    publisher: WorkflowStatusPublisher,
+    workflow_status: RunStatus,
+    job_ids_by_status: Dict[str, List[str]],
 ):
-    """Publish to MQ the job submission."""
-    running_jobs = {"total": 1, "job_ids": [reana_job_id]}
-    status_running = 1
+    """Publish to MQ the jobs that changed status, grouped by status."""
+    message = None
+    progress = {
+        status: {"total": len(job_ids), "job_ids": job_ids}
+        for status, job_ids in job_ids_by_status.items()
+        if job_ids
+    }
+    if progress:
+        message = {"progress": build_progress_message(**progress)}
     publisher.publish_workflow_status(
-        workflow_uuid,
-        status=status_running,
-        message={"progress": build_progress_message(running=running_jobs)},
+        workflow_uuid, workflow_status.value, message=message
+    )
+
+
+def count_workflow_jobs(job: "Job") -> int:
+    """Count the REANA jobs needed to run the DAG the given job belongs to.
+
+    The jobs of a Snakemake group are run together as a single REANA job,
+    while the jobs of ``localrules`` are run by Snakemake itself.
+    """
+    dag = job.dag
+    return len(
+        {
+            dag.get_job_group(j) or j
+            for j in (dag._needrun | dag._finished)
+            if not j.is_local
+        }
     )
+
+
+class WorkflowProgress:
+    """Keep track of the progress of a workflow run and publish it to MQ.
+
+    The total number of jobs is computed from the DAG only once, when the
+    first job is received, after which the running, finished and failed
+    counters are updated incrementally on every job event.
+
+    Job events are buffered and published together in one message once
+    ``flush_interval`` seconds have passed or ``batch_size`` events have
+    accumulated. Events changing the status of the workflow itself, e.g. a
+    failed job, are published immediately together with the buffered ones.
+    """
+
+    def __init__(
+        self,
+        workflow_uuid: str,
+        publisher: WorkflowStatusPublisher,
+        flush_interval: float = PROGRESS_PUBLISH_INTERVAL_IN_SECONDS,
+        batch_size: int = PROGRESS_PUBLISH_BATCH_SIZE,
+    ):
+        """Initialise the progress of a workflow run."""
+        self.workflow_uuid = workflow_uuid
+        self.publisher = publisher
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.total: Optional[int] = None
+        self.running = 0
+        self.finished = 0
+        self.failed = 0
+        # Jobs are submitted from the scheduler thread, while their status is
+        # checked from the executor's polling thread.
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+
+    @property
+    def started(self) -> bool:
+        """Whether the start of the workflow has already been published."""
+        return self.total is not None
+
+    def start(self, job: "Job") -> None:
+        """Publish the start of the workflow, unless already done."""
+        if self.started:
+            return
+        self.total = count_workflow_jobs(job)
+        publish_workflow_start(self.workflow_uuid, self.publisher, self.total)
+
+    def job_submitted(self, reana_job_id: str) -> None:
+        """Record and publish the submission of a job."""
+        with self._lock:
+            self.running += 1
+            self._add_pending(JobStatus.running, reana_job_id)
+            self._flush_if_due()
+
+    def job_status_changed(
+        self,
+        reana_job_id: Optional[str],
+        job_status: JobStatus,
+        workflow_status: RunStatus,
+    ) -> None:
+        """Record and publish a job reaching a final status.
+
+        Jobs that were not run by job-controller, e.g. restored from the result
+        cache or run in the engine, have no ``reana_job_id``. They are published
+        under a generated one, since workflow-controller counts the jobs of each
+        status by their ids.
+        """
+        with self._lock:
+            if reana_job_id:
+                self.running = max(self.running - 1, 0)
+            else:
+                reana_job_id = str(uuid.uuid4())
+            self._add_pending(job_status, reana_job_id)
+            if job_status == JobStatus.finished:
+                self.finished += 1
+            elif job_status == JobStatus.failed:
+                self.failed += 1
+            if workflow_status != RunStatus.running:
+                self._flush(workflow_status)
+            else:
+                self._flush_if_due()
+
+    def flush(self, workflow_status: RunStatus = RunStatus.running) -> None:
+        """Publish all the buffered job events right away."""
+        with self._lock:
+            if self._pending_count or workflow_status != RunStatus.running:
+                self._flush(workflow_status)
+
+    def flush_if_due(self) -> None:
+        """Publish the buffered job events if the flush interval has passed."""
+        with self._lock:
+            self._flush_if_due()
+
+    def _add_pending(self, job_status: JobStatus, reana_job_id: str) -> None:
+        self._pending.setdefault(job_status.name, []).append(reana_job_id)
+        self._pending_count += 1
+
+    def _flush_if_due(self) -> None:
+        if not self._pending_count:
+            return
+        if (
+            self._pending_count >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush(RunStatus.running)
+
+    def _flush(self, workflow_status: RunStatus) -> None:
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        self._last_flush = time.monotonic()
+        publish_jobs_progress(
+            self.workflow_uuid, self.publisher, workflow_status, pending
+        )
+
+
+class AdaptivePollInterval:
+    """Compute how long to wait before checking the status of jobs again.
+
+    The interval is halved after every polling round in which some jobs
+    finished and grows by half when nothing changed, staying between
+    ``floor`` and ``ceiling`` seconds. The runtimes observed for each rule
+    are used to wake up around the time the next active job is expected to
+    finish. Jobs running past their expected runtime are left to the backoff.
+    """
+
+    RUNTIME_SMOOTHING = 0.3
+    """Weight of the latest runtime in the per-rule moving average."""
+
+    def __init__(
+        self,
+        initial: float = POLL_JOBS_STATUS_SLEEP_IN_SECONDS,
+        floor: float = POLL_JOBS_STATUS_MIN_SLEEP_IN_SECONDS,
+        ceiling: float = POLL_JOBS_STATUS_MAX_SLEEP_IN_SECONDS,
+    ):
+        """Initialise the polling interval."""
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self.current = min(max(initial, self.floor), self.ceiling)
+        self.runtimes: Dict[str, float] = {}
+
+    def job_done(self, rule: str, submitted_at: float, now: float) -> None:
+        """Record the runtime of a job that is no longer running."""
+        runtime = max(now - submitted_at, 0.0)
+        previous = self.runtimes.get(rule)
+        if previous is None:
+            self.runtimes[rule] = runtime
+        else:
+            self.runtimes[rule] = (
+                self.RUNTIME_SMOOTHING * runtime
+                + (1 - self.RUNTIME_SMOOTHING) * previous
+            )
+
+    def next(
+        self,
+        jobs_done: int,
+        active_jobs: Iterable[Tuple[str, Optional[float]]],
+        now: float,
+    ) -> float:
+        """Get the time to sleep after a polling round.
+
+        :param jobs_done: Number of jobs that finished or failed in the round.
+        :param active_jobs: Rule and submission time of the jobs still running.
+        :param now: Current time, on the same clock as the submission times.
+        """
+        if jobs_done:
+            self.current = max(self.current / 2, self.floor)
+        else:
+            self.current = min(self.current * 1.5, self.ceiling)
+
+        sleep = self.current
+        for rule, submitted_at in active_jobs:
+            runtime = self.runtimes.get(rule)
+            if runtime is None or submitted_at is None:
+                continue
+            expected_in = submitted_at + runtime - now
+            if expected_in > 0:
+                sleep = min(sleep, max(expected_in, self.floor))
+        return sleep
+
+
+class AdaptiveConcurrencyLimit:
+    """Compute how many jobs can be in flight, adjusting it to the cluster load.
+
+    The limit grows by one for every job that finishes until the first sign
+    of overload, doubling it every round of jobs, and then by one for every
+    round of jobs. It is halved, at most once every ``decrease_interval``
+    seconds, whenever job-controller takes more than ``latency_threshold``
+    seconds to accept a job, fails to accept one, or reports more than
+    ``queued_ratio`` of the jobs in flight as queued.
+    """
+
+    def __init__(
+        self,
+        initial: int = ADAPTIVE_CONCURRENCY_INITIAL,
+        floor: int = ADAPTIVE_CONCURRENCY_MIN,
+        ceiling: int = SNAKEMAKE_MAX_PARALLEL_JOBS,
+        latency_threshold: float = ADAPTIVE_CONCURRENCY_SUBMIT_LATENCY_IN_SECONDS,
+        queued_ratio: float = ADAPTIVE_CONCURRENCY_QUEUED_RATIO,
+        decrease_interval: float = ADAPTIVE_CONCURRENCY_DECREASE_INTERVAL_IN_SECONDS,
+    ):
+        """Initialise the concurrency limit."""
+        self.floor = max(floor, 1)
+        self.ceiling = max(ceiling, self.floor)
+        self.limit = float(min(max(initial, self.floor), self.ceiling))
+        self.latency_threshold = latency_threshold
+        self.queued_ratio = queued_ratio
+        self.decrease_interval = decrease_interval
+        self.slow_start = True
+        self._last_decrease: Optional[float] = None
+        # Updated from the submission workers and the status checks.
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> int:
+        """Get the number of jobs allowed in flight."""
+        return int(self.limit)
+
+    def job_finished(self) -> None:
+        """Grow the limit after a job finished successfully."""
+        with self._lock:
+            increase = 1 if self.slow_start else 1 / self.limit
+            self.limit = min(self.limit + increase, self.ceiling)
+
+    def job_submitted(self, latency: float, now: Optional[float] = None) -> None:
+        """Shrink the limit if job-controller was slow to accept a job."""
+        if latency > self.latency_threshold:
+            self._decrease(
+                f"job submission took {latency:.1f}s",
+                time.monotonic() if now is None else now,
+            )
+
+    def submission_failed(self, now: Optional[float] = None) -> None:
+        """Shrink the limit after job-controller failed to accept a job."""
+        self._decrease(
+            "job submission failed", time.monotonic() if now is None else now
+        )
+
+    def jobs_checked(
+        self, active_jobs: int, queued_jobs: int, now: Optional[float] = None
+    ) -> None:
+        """Shrink the limit if too many of the jobs in flight are queued."""
+        if active_jobs and queued_jobs / active_jobs > self.queued_ratio:
+            self._decrease(
+                f"{queued_jobs} of {active_jobs} jobs are queued",
+                time.monotonic() if now is None else now,
+            )
+
+    def _decrease(self, reason: str, now: float) -> None:
+        with self._lock:
+            if (
+                self._last_decrease is not None
+                and now - self._last_decrease < self.decrease_interval
+            ):
+                return
+            self._last_decrease = now
+            self.slow_start = False
+            self.limit = max(self.limit / 2, self.floor)
+        log.info(f"Allowing {self.current} jobs in flight, as {reason}")
+
+
+class CriticalPathPriority:
+    """Rank jobs by the length of the longest chain of jobs they are holding up.
+
+    The critical path length of a job is its own weight plus the largest
+    critical path length of the jobs depending on it, among the jobs that
+    still have to run. Jobs weigh their ``runtime`` resource, in minutes,
+    when set, and 1 otherwise. Submitting the jobs with the longest critical
+    paths first shortens the workflow runtime when not all ready jobs can run
+    at the same time.
+
+    Lengths are computed for the whole DAG at once, and computed again when
+    a job that was not in the DAG appears, e.g. after a checkpoint.
+    """
+
+    def __init__(self):
+        """Initialise the critical path lengths."""
+        self.lengths: Dict["Job", float] = {}
+
+    def get(self, job: "Job") -> float:
+        """Get the critical path length of a job, or of a group of jobs."""
+        if job.is_group():
+            return max((self.get(member) for member in job.jobs), default=0)
+        length = self.lengths.get(job)
+        if length is None:
+            self._compute(job.dag)
+            length = self.lengths.get(job, self._weight(job))
+        return length
+
+    def _compute(self, dag) -> None:
+        """Compute the critical path length of all the jobs that have to run."""
+        needrun = set(dag.needrun_jobs())
+        lengths = {}
+        # Jobs depending on others come in later levels, so are done first.
+        for level in reversed(list(dag.toposorted(needrun))):
+            for job in level:
+                lengths[job] = self._weight(job) + max(
+                    (
+                        lengths.get(dependent, 0)
+                        for dependent in dag.depending.get(job, {})
+                        if dependent in needrun
+                    ),
+                    default=0,
+                )
+        self.lengths = lengths
+
+    @staticmethod
+    def _weight(job: "Job") -> float:
+        """Get the expected runtime of a job, in minutes."""
+        runtime = job.resources.get("runtime")
+        if isinstance(runtime, (int, float)) and runtime > 0:
+            return runtime
+        return 1
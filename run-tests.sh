@@ -99,6 +99,10 @@ lint_yamllint() {
     yamllint .
 }
 
+python_benchmarks() {
+    python benchmarks/bench_run_jobs.py "${@:2}"
+}
+
 python_tests() {
     pytest
 }
@@ -140,6 +144,7 @@ help() {
     echo "  --lint-pydocstyle      Check linting of Python docstrings"
     echo "  --lint-shellcheck      Check linting of shell scripts"
     echo "  --lint-yamllint        Check linting of YAML files"
+    echo "  --python-benchmarks    Run Python engine benchmarks"
     echo "  --python-tests         Check Python test suite"
 }
 
@@ -166,6 +171,7 @@ case $arg in
 --lint-pydocstyle) lint_pydocstyle ;;
 --lint-shellcheck) lint_shellcheck ;;
 --lint-yamllint) lint_yamllint ;;
+--python-benchmarks) python_benchmarks "$@" ;;
 --python-tests) python_tests ;;
 *) echo "[ERROR] Invalid argument '$arg'. Exiting." && help && exit 1 ;;
 esac
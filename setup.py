@@ -73,6 +73,8 @@ setup(
         "console_scripts": [
             "run-snakemake-workflow="
             "reana_workflow_engine_snakemake.cli:run_snakemake_workflow",
+            "generate-snakemake-report="
+            "reana_workflow_engine_snakemake.cli:generate_snakemake_report",
         ]
     },
     python_requires=">=3.8",
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job-controller HTTP client tests."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from reana_workflow_engine_snakemake.api_client import (
+    PooledHTTPAdapter,
+    create_http_client,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answer every request with an empty JSON object over HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Send an empty JSON object."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        """Do not log requests."""
+
+
+@pytest.fixture
+def server_url():
+    """Run a local HTTP server keeping connections alive."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledHTTPAdapter:
+    """Tests for PooledHTTPAdapter."""
+
+    def test_connections_are_reused(self, server_url):
+        """Test that consecutive requests share one connection."""
+        adapter = PooledHTTPAdapter(pool_size=2)
+        session = create_http_client(adapter).session
+        for _ in range(5):
+            assert session.get(f"{server_url}/jobs").status_code == 200
+        assert adapter.connection_stats() == {"connections": 1, "requests": 5}
+
+    def test_default_timeout(self, server_url):
+        """Test that requests without timeout get the default one."""
+        adapter = PooledHTTPAdapter(pool_size=1, timeout=(1, 2))
+        session = create_http_client(adapter).session
+        with patch.object(
+            HTTPAdapter, "send", autospec=True, side_effect=HTTPAdapter.send
+        ) as send:
+            session.get(f"{server_url}/jobs")
+            session.get(f"{server_url}/jobs", timeout=5)
+        assert send.call_args_list[0].kwargs["timeout"] == (1, 2)
+        assert send.call_args_list[1].kwargs["timeout"] == 5
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake workspace file checksum tests."""
+
+import hashlib
+import mmap
+import os
+
+import pytest
+
+from reana_workflow_engine_snakemake.checksum import ChecksumService
+
+CHUNK_SIZE = mmap.ALLOCATIONGRANULARITY
+
+
+class TestChecksumService:
+    """Tests for ChecksumService."""
+
+    def test_small_file_checksum_is_sha256(self, tmp_path):
+        """Test that files fitting in one chunk get their plain SHA-256 digest."""
+        data = tmp_path / "data.txt"
+        data.write_bytes(b"1\n2\n3\n")
+        service = ChecksumService(max_workers=1)
+
+        assert service.checksum(str(data)) == hashlib.sha256(b"1\n2\n3\n").hexdigest()
+        empty = tmp_path / "empty.txt"
+        empty.write_bytes(b"")
+        assert service.checksum(str(empty)) == hashlib.sha256(b"").hexdigest()
+
+    def test_chunks_are_hashed_in_parallel(self, tmp_path):
+        """Test that large files hashed by several processes get the same checksum."""
+        data = tmp_path / "data.bin"
+        data.write_bytes(os.urandom(CHUNK_SIZE * 3 + 10))
+        parallel = ChecksumService(max_workers=2, chunk_size=CHUNK_SIZE)
+        try:
+            checksum = parallel.checksum(str(data))
+        finally:
+            parallel.close()
+
+        serial = ChecksumService(max_workers=1, chunk_size=CHUNK_SIZE)
+        assert checksum == serial.checksum(str(data))
+        assert checksum != hashlib.sha256(data.read_bytes()).hexdigest()
+
+    def test_unchanged_files_are_not_read_again(self, tmp_path):
+        """Test that the persistent index is reused until a file changes."""
+        index_path = str(tmp_path / "reana" / "checksums.json")
+        (tmp_path / "dir").mkdir()
+        (tmp_path / "dir" / "a.txt").write_text("a")
+        (tmp_path / "dir" / "b.txt").write_text("b")
+        service = ChecksumService(index_path, max_workers=1)
+        checksum = service.checksum(str(tmp_path / "dir"))
+        service.close()
+
+        service = ChecksumService(index_path, max_workers=1)
+        assert service.checksum(str(tmp_path / "dir")) == checksum
+        assert (service.hits, service.misses) == (2, 0)
+
+        (tmp_path / "dir" / "b.txt").write_text("bb")
+        assert service.checksum(str(tmp_path / "dir")) != checksum
+        assert (service.hits, service.misses) == (3, 1)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing file is reported as an error."""
+        with pytest.raises(OSError):
+            ChecksumService().checksum(str(tmp_path / "missing.txt"))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake command line interface tests."""
+
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from reana_workflow_engine_snakemake import utils
+from reana_workflow_engine_snakemake.cli import (
+    generate_snakemake_report,
+    run_snakemake_workflow_engine_adapter,
+)
+
+
+def test_snakemake_is_not_imported_on_startup():
+    """Test that starting the engine does not wait for Snakemake to be imported."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, reana_workflow_engine_snakemake.cli; "
+            "print(any(m.split('.')[0] == 'snakemake' for m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert process.stdout.strip() == "False"
+
+
+def test_running_status_is_published_first(monkeypatch, tmp_path):
+    """Test that the workflow is reported running before the jobs are run."""
+    monkeypatch.setattr(utils, "_workflow_identity", None)
+    monkeypatch.setattr("os.umask", MagicMock())
+    publisher = MagicMock()
+
+    def run_jobs(*args, **kwargs):
+        publisher.publish_workflow_status.assert_called_once_with("workflow-uuid", 1)
+        return False
+
+    with patch("reana_workflow_engine_snakemake.runner.run_jobs", run_jobs):
+        run_snakemake_workflow_engine_adapter(
+            publisher,
+            MagicMock(),
+            workflow_uuid="workflow-uuid",
+            workflow_workspace=str(tmp_path),
+            workflow_file="Snakefile",
+        )
+
+    assert publisher.publish_workflow_status.call_args.args == ("workflow-uuid", 3)
+
+
+def test_generate_report_exit_code(monkeypatch, tmp_path):
+    """Test that the report command fails when no report could be generated."""
+    monkeypatch.setattr("os.umask", MagicMock())
+    with patch(
+        "reana_workflow_engine_snakemake.runner.generate_report",
+        side_effect=[True, False],
+    ) as generate_report:
+        assert (
+            CliRunner().invoke(generate_snakemake_report, [str(tmp_path)]).exit_code
+            == 0
+        )
+        assert (
+            CliRunner().invoke(generate_snakemake_report, [str(tmp_path)]).exit_code
+            == 1
+        )
+    generate_report.assert_called_with(str(tmp_path))
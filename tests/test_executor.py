@@ -8,7 +8,39 @@
 
 """REANA-Workflow-Engine-Snakemake executor tests."""
 
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bravado.exception import HTTPBadGateway, HTTPNotFound
+from snakemake_interface_common.exceptions import WorkflowError
+from snakemake_interface_executor_plugins.executors.base import SubmittedJobInfo
+from reana_commons.api_client import JobControllerAPIClient
+from throttler import Throttler
+
+from reana_workflow_engine_snakemake import executor as reana_executor
+from reana_workflow_engine_snakemake.api_client import (
+    PooledHTTPAdapter,
+    create_http_client,
+)
+from reana_workflow_engine_snakemake.config import RunStatus
 from reana_workflow_engine_snakemake.executor import Executor
+from reana_workflow_engine_snakemake.job_status import JobStatusTable
+from reana_workflow_engine_snakemake.journal import JobJournal
+from reana_workflow_engine_snakemake.metrics import ExecutorMetrics
+from reana_workflow_engine_snakemake.result_cache import ResultCache
+from reana_workflow_engine_snakemake.utils import (
+    AdaptiveConcurrencyLimit,
+    AdaptivePollInterval,
+    WorkflowIdentity,
+)
 
 
 class MockJob:
@@ -39,3 +71,858 @@ class TestBuildJobName:
         assert "process" in result
         assert "sample=A" in result
         assert "fileno=22" in result
+
+
+def make_executor():
+    """Create an executor with job-controller and MQ mocked.
+
+    The executor is set up by its own ``__post_init__``. The restart journal
+    is left off, the tests needing it set up their own.
+    """
+    executor = Executor.__new__(Executor)
+    # Set by Snakemake's RemoteExecutor constructor.
+    executor.status_rate_limiter = Throttler(rate_limit=1000)
+    with patch.multiple(
+        reana_executor,
+        get_workflow_identity=MagicMock(
+            return_value=WorkflowIdentity("workflow-uuid", "/workspace")
+        ),
+        JobControllerAPIClient=MagicMock(),
+        WorkflowStatusPublisher=MagicMock(),
+        RESTART_JOURNAL=False,
+    ):
+        executor.__post_init__()
+    return executor
+
+
+class JobsListingHandler(BaseHTTPRequestHandler):
+    """Answer with the job listing returned by job-controller."""
+
+    requests = []
+
+    def do_GET(self):
+        """Send the listing of two jobs."""
+        JobsListingHandler.requests.append(self.path)
+        body = json.dumps(
+            {
+                "jobs": {
+                    "1": {"job_id": "1", "status": "finished", "cmd": "date"},
+                    "2": {"job_id": "2", "status": "running", "cmd": "date"},
+                }
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Do not log requests."""
+
+
+@pytest.fixture
+def jobs_listing_url():
+    """Run a local HTTP server answering like job-controller."""
+    JobsListingHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JobsListingHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestGetJobsStatusFromController:
+    """Tests for bulk job status polling."""
+
+    def test_parse_jobs_list(self):
+        """Test parsing a list of jobs."""
+        response = [
+            {"job_id": "1", "status": "finished"},
+            {"job_id": "2", "status": "running"},
+        ]
+        assert Executor._parse_jobs_statuses(response) == {
+            "1": "finished",
+            "2": "running",
+        }
+
+    def test_parse_jobs_dict(self):
+        """Test parsing the ``{"jobs": {job_id: job}}`` listing."""
+        response = {"jobs": {"1": {"status": "failed"}, "2": {"cmd": "date"}}}
+        assert Executor._parse_jobs_statuses(response) == {"1": "failed"}
+
+    def test_bulk_query(self, jobs_listing_url):
+        """Test that all statuses are fetched with a single request.
+
+        The request goes through the job-controller spec, which does not
+        match the listing job-controller actually returns.
+        """
+        executor = make_executor()
+        executor.rjc_api_client = JobControllerAPIClient(
+            "reana-job-controller",
+            http_client=create_http_client(PooledHTTPAdapter(pool_size=1)),
+        )
+        executor.rjc_api_client._client.swagger_spec.api_url = jobs_listing_url
+
+        assert executor._get_jobs_status_from_controller() == {
+            "1": "finished",
+            "2": "running",
+        }
+        assert JobsListingHandler.requests == ["/jobs"]
+        assert executor.bulk_status_supported
+
+    def _make_executor(self, status_code=200):
+        """Create an executor whose job listing answers with the given status."""
+        executor = make_executor()
+        get_jobs = executor.rjc_api_client._client.jobs.get_jobs
+        get_jobs.return_value.future.result.return_value.status_code = status_code
+        return executor
+
+    def test_bulk_query_unsupported(self):
+        """Test that bulk polling is disabled when job-controller lacks it."""
+        for status_code in (404, 405):
+            executor = self._make_executor(status_code)
+            assert executor._get_jobs_status_from_controller() == {}
+            assert not executor.bulk_status_supported
+
+    def test_bulk_query_unparsable(self):
+        """Test that bulk polling is disabled when the listing is not understood."""
+        executor = self._make_executor()
+        get_jobs = executor.rjc_api_client._client.jobs.get_jobs
+        response = get_jobs.return_value.future.result.return_value
+        response.json.side_effect = ValueError("Expecting value")
+        assert executor._get_jobs_status_from_controller() == {}
+        assert not executor.bulk_status_supported
+
+    def test_bulk_query_transient_error(self):
+        """Test that other errors only skip bulk polling for the current round."""
+        executor = self._make_executor(503)
+        get_jobs = executor.rjc_api_client._client.jobs.get_jobs
+        response = get_jobs.return_value.future.result.return_value
+        response.raise_for_status.side_effect = Exception("503 Service Unavailable")
+        assert executor._get_jobs_status_from_controller() == {}
+        assert executor.bulk_status_supported
+
+        get_jobs.return_value.future.result.side_effect = ConnectionError("timeout")
+        assert executor._get_jobs_status_from_controller() == {}
+        assert executor.bulk_status_supported
+
+
+class TestCheckActiveJobs:
+    """Tests for Executor.check_active_jobs method."""
+
+    def _check(self, executor, active_jobs):
+        """Run ``check_active_jobs`` and collect the jobs still running."""
+
+        async def _collect():
+            return [job async for job in executor.check_active_jobs(active_jobs)]
+
+        return asyncio.run(_collect())
+
+    def _make_active_job(self, job_id):
+        """Create a submitted job mock."""
+        active_job = MagicMock(external_jobid=job_id, aux=None)
+        active_job.job.is_norun = False
+        active_job.job.is_group.return_value = False
+        return active_job
+
+    def test_statuses_are_dispatched(self):
+        """Test that finished, failed and running jobs are handled."""
+        executor = make_executor()
+        executor.bulk_status_supported = False
+        executor.report_job_success = MagicMock()
+        executor.report_job_error = MagicMock()
+        statuses = {"1": "finished", "2": "failed", "3": "running"}
+        executor.rjc_api_client.check_status.side_effect = lambda job_id: MagicMock(
+            status=statuses[job_id]
+        )
+        finished, failed, running = [
+            self._make_active_job(job_id) for job_id in statuses
+        ]
+
+        still_active = self._check(executor, [finished, failed, running])
+
+        assert still_active == [running]
+        executor.report_job_success.assert_called_once_with(finished)
+        executor.report_job_error.assert_called_once_with(failed)
+        assert executor.next_seconds_between_status_checks == 5
+        assert executor.metrics.status_check_seconds.count == 3
+        assert executor.metrics.poll_round_seconds.count == 1
+        assert executor.metrics.active_jobs.value == 1
+        assert executor.metrics.jobs_finished.value == 1
+        assert executor.metrics.jobs_failed.value == 1
+
+    def test_missing_bulk_statuses_are_checked_individually(self):
+        """Test fallback to per-job requests for jobs absent from the listing."""
+        executor = make_executor()
+        executor.report_job_success = MagicMock()
+        get_jobs = executor.rjc_api_client._client.jobs.get_jobs
+        get_jobs.return_value.future.result.return_value.json.return_value = {
+            "jobs": {"1": {"job_id": "1", "status": "running"}}
+        }
+        executor.rjc_api_client.check_status.return_value = MagicMock(status="finished")
+        running, finished = self._make_active_job("1"), self._make_active_job("2")
+
+        still_active = self._check(executor, [running, finished])
+
+        assert still_active == [running]
+        executor.rjc_api_client.check_status.assert_called_once_with("2")
+        executor.report_job_success.assert_called_once_with(finished)
+
+    def test_group_jobs_are_checked(self):
+        """Test that group jobs, which have no ``is_norun``, are checked."""
+        executor = make_executor()
+        executor.bulk_status_supported = False
+        executor.report_job_success = MagicMock()
+        statuses = {"1": "finished", "2": "running"}
+        executor.rjc_api_client.check_status.side_effect = lambda job_id: MagicMock(
+            status=statuses[job_id]
+        )
+        finished, running = [
+            SubmittedJobInfo(job=MockGroupJob([]), external_jobid=job_id)
+            for job_id in statuses
+        ]
+
+        still_active = self._check(executor, [finished, running])
+
+        assert still_active == [running]
+        executor.report_job_success.assert_called_once_with(finished)
+
+    def test_rate_limiter_is_acquired_once_per_round(self):
+        """Test that a round of status checks counts once against the rate limit."""
+        executor = make_executor()
+        executor.bulk_status_supported = False
+        executor.rjc_api_client.check_status.return_value = MagicMock(status="running")
+        acquisitions = []
+
+        class CountingRateLimiter:
+            async def __aenter__(self):
+                acquisitions.append(1)
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        executor.status_rate_limiter = CountingRateLimiter()
+        active_jobs = [self._make_active_job(str(i)) for i in range(5)]
+
+        self._check(executor, active_jobs)
+
+        assert executor.rjc_api_client.check_status.call_count == 5
+        assert len(acquisitions) == 1
+
+    def test_notified_statuses_are_used_without_requests(self):
+        """Test that notified statuses avoid requests to job-controller."""
+        executor = make_executor()
+        executor.job_status_table = JobStatusTable()
+        executor.last_status_reconciliation = time.monotonic()
+        executor.report_job_success = MagicMock()
+        executor.job_status_table.update("1", "finished")
+        finished, pending = self._make_active_job("1"), self._make_active_job("2")
+
+        still_active = self._check(executor, [finished, pending])
+
+        assert still_active == [pending]
+        executor.report_job_success.assert_called_once_with(finished)
+        executor.rjc_api_client._client.jobs.get_jobs.assert_not_called()
+        executor.rjc_api_client.check_status.assert_not_called()
+        assert executor.job_status_table.get_many(["1"]) == {}
+
+    def test_jobs_without_notifications_are_reconciled(self):
+        """Test that job-controller is polled once the reconciliation is due."""
+        executor = make_executor()
+        executor.bulk_status_supported = False
+        executor.job_status_table = JobStatusTable()
+        executor.last_status_reconciliation = 0
+        executor.report_job_success = MagicMock()
+        executor.rjc_api_client.check_status.return_value = MagicMock(status="finished")
+        finished = self._make_active_job("1")
+
+        assert self._check(executor, [finished]) == []
+        executor.rjc_api_client.check_status.assert_called_once_with("1")
+        assert executor.last_status_reconciliation > 0
+
+
+class TestSubmitAndReportJob:
+    """Tests for Executor._submit_and_report_job method."""
+
+    def test_submission_is_reported(self):
+        """Test that the returned job id is reported to Snakemake."""
+        executor = make_executor()
+        executor.report_job_submission = MagicMock()
+        executor.rjc_api_client.submit.return_value = {"job_id": "1"}
+        job = MockJob(name="calculate")
+
+        executor._submit_and_report_job(job, {"cmd": "date"})
+
+        executor.rjc_api_client.submit.assert_called_once_with(cmd="date")
+        job_info = executor.report_job_submission.call_args.args[0]
+        assert job_info.job is job
+        assert job_info.external_jobid == "1"
+        assert executor.metrics.submit_seconds.count == 1
+        assert executor.metrics.jobs_submitted.value == 1
+
+    def test_wait_for_submission_is_measured(self, monkeypatch):
+        """Test that the time from job ready to job submitted is recorded."""
+        monkeypatch.setattr(
+            reana_executor.RemoteExecutor, "report_job_submission", MagicMock()
+        )
+        executor = make_executor()
+        job = MockJob(name="calculate")
+        executor.job_ready_at[job] = time.monotonic() - 2
+
+        executor.report_job_submission(SubmittedJobInfo(job=job, external_jobid="1"))
+
+        assert executor.job_ready_at == {}
+        assert executor.metrics.job_wait_seconds.count == 1
+        assert executor.metrics.job_wait_seconds.sum >= 2
+
+    def test_submission_error_is_reported(self):
+        """Test that a failed submission is reported as a job error."""
+        executor = make_executor()
+        executor.report_job_submission = MagicMock()
+        executor.report_job_error = MagicMock()
+        executor.rjc_api_client.submit.side_effect = Exception("unavailable")
+        job = MockJob(name="calculate")
+
+        executor._submit_and_report_job(job, {"cmd": "date"})
+
+        executor.report_job_submission.assert_not_called()
+        job_info = executor.report_job_error.call_args.args[0]
+        assert job_info.job is job
+        assert job_info.external_jobid is None
+
+
+class TestRestartJournal:
+    """Tests for reattaching to the jobs submitted before a restart."""
+
+    def _make_executor(self, tmp_path):
+        """Create an executor with a restart journal in ``tmp_path``."""
+        executor = make_executor()
+        executor.journal = JobJournal(str(tmp_path / "jobs.jsonl"))
+        executor.report_job_submission = MagicMock()
+        executor.report_job_success = MagicMock()
+        executor.rjc_api_client.submit.return_value = {"job_id": "new"}
+        return executor
+
+    def _make_job(self, output):
+        """Create a shell job mock."""
+        job = MagicMock(wildcards={"i": "1"}, input=[], output=[output])
+        job.name = "make"
+        job.is_group.return_value = False
+        return job
+
+    def _submit(self, executor, job):
+        """Queue a job for submission and wait for it to be submitted."""
+        executor._queue_job_submission(job, {"image": "bash", "cmd": "date"})
+        executor.submission_pool.shutdown(wait=True)
+        executor.submission_pool = ThreadPoolExecutor(max_workers=4)
+
+    def test_submitted_jobs_are_journaled(self, tmp_path):
+        """Test that a new job is submitted and recorded in the journal."""
+        executor = self._make_executor(tmp_path)
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+        executor.journal.close()
+
+        (entry,) = JobJournal(str(tmp_path / "jobs.jsonl")).entries.values()
+        assert entry["job_id"] == "new"
+        assert entry["wildcards"] == {"i": "1"}
+        assert executor.journal_keys == {}
+
+    def test_active_job_is_reattached(self, tmp_path):
+        """Test that a job still running before the restart is polled again."""
+        executor = self._make_executor(tmp_path)
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+        executor.journal.update_status("new", "running")
+        executor.rjc_api_client.submit.reset_mock()
+        job = self._make_job(str(tmp_path / "out.txt"))
+
+        self._submit(executor, job)
+
+        executor.rjc_api_client.submit.assert_not_called()
+        job_info = executor.report_job_submission.call_args.args[0]
+        assert (job_info.job, job_info.external_jobid) == (job, "new")
+
+    def test_unknown_active_job_is_resubmitted(self, tmp_path):
+        """Test that a job job-controller no longer knows about is submitted again."""
+        executor = self._make_executor(tmp_path)
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+        executor.journal.update_status("new", "queued")
+        executor.rjc_api_client.submit.reset_mock()
+        executor.rjc_api_client.check_status.side_effect = HTTPNotFound(
+            MagicMock(status_code=404)
+        )
+
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+
+        executor.rjc_api_client.check_status.assert_called_once_with("new")
+        executor.rjc_api_client.submit.assert_called_once()
+        assert executor.jobs_in_flight == 0
+
+    def test_finished_job_is_accepted(self, tmp_path):
+        """Test that a job that finished before the restart is not run again."""
+        output = tmp_path / "out.txt"
+        executor = self._make_executor(tmp_path)
+        self._submit(executor, self._make_job(str(output)))
+        executor.journal.update_status("new", "finished")
+        executor.rjc_api_client.submit.reset_mock()
+        executor.report_job_submission.reset_mock()
+        output.write_text("done")
+
+        self._submit(executor, self._make_job(str(output)))
+
+        executor.rjc_api_client.submit.assert_not_called()
+        executor.report_job_submission.assert_not_called()
+        assert executor.report_job_success.call_args.args[0].external_jobid == "new"
+
+    def test_failed_job_is_resubmitted(self, tmp_path):
+        """Test that a job that failed before the restart is submitted again."""
+        executor = self._make_executor(tmp_path)
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+        executor.journal.update_status("new", "failed")
+        executor.rjc_api_client.submit.reset_mock()
+
+        self._submit(executor, self._make_job(str(tmp_path / "out.txt")))
+
+        executor.rjc_api_client.submit.assert_called_once()
+
+
+class TestResultCache:
+    """Tests for restoring job outputs from the result cache."""
+
+    def _make_job(self, tmp_path):
+        """Create a shell job mock writing ``out.txt`` from ``in.txt``."""
+        job = MagicMock(
+            input=[str(tmp_path / "in.txt")], output=[str(tmp_path / "out.txt")]
+        )
+        job.name = "make"
+        job.is_group.return_value = False
+        return job
+
+    def _run(self, executor, job):
+        """Queue a job and, if submitted, report it finished."""
+        executor._queue_job_submission(
+            job, {"image": "bash", "prettified_cmd": "cp in.txt out.txt"}
+        )
+        executor.submission_pool.shutdown(wait=True)
+        executor.submission_pool = ThreadPoolExecutor(max_workers=4)
+        if executor.rjc_api_client.submit.called:
+            (output,) = job.output
+            with open(output, "w") as f:
+                f.write("result")
+            executor.bulk_status_supported = False
+            executor.rjc_api_client.check_status.return_value = MagicMock(
+                status="finished"
+            )
+            active_job = MagicMock(job=job, external_jobid="1", aux=None)
+
+            async def _check():
+                return [job async for job in executor.check_active_jobs([active_job])]
+
+            asyncio.run(_check())
+            executor.submission_pool.shutdown(wait=True)
+            executor.submission_pool = ThreadPoolExecutor(max_workers=4)
+
+    def test_identical_job_is_restored(self, tmp_path):
+        """Test that a job run before on the same inputs is not submitted."""
+        (tmp_path / "in.txt").write_text("input")
+        executor = make_executor()
+        executor.result_cache = ResultCache(str(tmp_path / "cache"), str(tmp_path))
+        executor.report_job_submission = MagicMock()
+        executor.report_job_success = MagicMock()
+        executor.rjc_api_client.submit.return_value = {"job_id": "1"}
+        self._run(executor, self._make_job(tmp_path))
+        executor.rjc_api_client.submit.reset_mock()
+        (tmp_path / "out.txt").unlink()
+
+        job = self._make_job(tmp_path)
+        self._run(executor, job)
+
+        executor.rjc_api_client.submit.assert_not_called()
+        assert executor.report_job_success.call_args.args[0].job is job
+        assert (tmp_path / "out.txt").read_text() == "result"
+        assert executor.metrics.result_cache_hits.value == 1
+        assert executor.result_cache_keys == {}
+        executor.progress.flush()
+        message = (
+            executor.publisher._publisher.publish_workflow_status.call_args.kwargs[
+                "message"
+            ]
+        )
+        assert message["progress"]["finished"]["total"] == 2
+
+    def test_changed_input_is_submitted(self, tmp_path):
+        """Test that a job is submitted again when its inputs changed."""
+        (tmp_path / "in.txt").write_text("input")
+        executor = make_executor()
+        executor.result_cache = ResultCache(str(tmp_path / "cache"), str(tmp_path))
+        executor.report_job_submission = MagicMock()
+        executor.rjc_api_client.submit.return_value = {"job_id": "1"}
+        self._run(executor, self._make_job(tmp_path))
+        executor.rjc_api_client.submit.reset_mock()
+        (tmp_path / "in.txt").write_text("other input")
+
+        self._run(executor, self._make_job(tmp_path))
+
+        executor.rjc_api_client.submit.assert_called_once()
+        assert executor.metrics.result_cache_hits.value == 0
+
+
+class TestCriticalPathOrdering:
+    """Tests for submitting the jobs on the longest paths first."""
+
+    def test_jobs_are_run_by_priority(self):
+        """Test that ready jobs are run in decreasing critical path length."""
+        executor = make_executor()
+        executor.run_job_pre = MagicMock()
+        executor.run_job = MagicMock()
+        lengths = {"a": 1, "b": 5, "c": 3}
+        executor.critical_path = MagicMock()
+        executor.critical_path.get.side_effect = lambda job: lengths[job.name]
+        jobs = [MockJob(name=name) for name in lengths]
+
+        executor.run_jobs(jobs)
+
+        assert [call.args[0].name for call in executor.run_job.call_args_list] == [
+            "b",
+            "c",
+            "a",
+        ]
+
+    def test_priority_hint_is_not_sent_to_single_submission(self):
+        """Test that the single job endpoint does not receive the priority."""
+        executor = make_executor()
+        executor.rjc_api_client.submit.return_value = {"job_id": "1"}
+
+        executor._submit_job({"cmd": "date", "priority": 3})
+
+        executor.rjc_api_client.submit.assert_called_once_with(cmd="date")
+
+
+class TestAdaptiveConcurrency:
+    """Tests for holding jobs back while the concurrency limit is reached."""
+
+    def test_held_jobs_are_released_by_priority(self):
+        """Test that jobs wait for room in flight, highest priority first."""
+        executor = make_executor()
+        executor.concurrency = AdaptiveConcurrencyLimit(initial=1, ceiling=1)
+        executor.report_job_submission = MagicMock()
+        executor.report_job_success = MagicMock()
+        executor.rjc_api_client.submit.side_effect = lambda **body: {
+            "job_id": body["cmd"]
+        }
+        executor.rjc_api_client.check_status.return_value = MagicMock(status="finished")
+        executor.bulk_status_supported = False
+        for name, priority in (("a", 1), ("b", 1), ("c", 5)):
+            executor._queue_job_submission(
+                MockJob(name=name), {"cmd": name, "priority": priority}
+            )
+        executor._release_held_submissions()
+        executor.submission_pool.shutdown(wait=True)
+        assert executor.jobs_in_flight == 1
+        assert executor.metrics.jobs_held.value == 2
+
+        submitted = []
+        for _ in range(3):
+            (job_info,) = executor.report_job_submission.call_args.args
+            submitted.append(job_info.external_jobid)
+            executor.submission_pool = ThreadPoolExecutor(max_workers=1)
+            job_info.job.is_norun = False
+            job_info.job.is_group = lambda: False
+            TestCheckActiveJobs()._check(executor, [job_info])
+            executor.submission_pool.shutdown(wait=True)
+
+        assert submitted == ["c", "a", "b"]
+        assert executor.jobs_in_flight == 0
+
+    def test_recently_submitted_queued_jobs_are_ignored(self):
+        """Test that jobs queued right after being submitted keep the limit."""
+        executor = make_executor()
+        executor.concurrency = AdaptiveConcurrencyLimit(initial=8, ceiling=8)
+        executor.bulk_status_supported = False
+        executor.rjc_api_client.check_status.return_value = MagicMock(status="queued")
+        check = TestCheckActiveJobs()
+        active_jobs = [check._make_active_job(str(i)) for i in range(4)]
+        for active_job in active_jobs:
+            active_job.aux = {"submitted_at": time.monotonic()}
+
+        check._check(executor, active_jobs)
+        assert executor.concurrency.current == 8
+
+        for active_job in active_jobs:
+            active_job.aux = {"submitted_at": time.monotonic() - 600}
+        check._check(executor, active_jobs)
+        assert executor.concurrency.current == 4
+
+
+class MockShellJob:
+    """Mock shell job object for testing."""
+
+    def __init__(self, name, shellcmd, image=None, is_shell=True, is_pipe=False):
+        self.name = name
+        self.wildcards = {}
+        self.shellcmd = shellcmd
+        self.container_img_url = image
+        self.is_shell = is_shell
+        self.is_pipe = is_pipe
+        self.is_service = False
+        self.is_norun = False
+        self.resources = {}
+
+    def __lt__(self, other):
+        return self.name < other.name
+
+
+class MockGroupJob:
+    """Mock group job object for testing."""
+
+    def __init__(self, toposorted):
+        self.name = "group"
+        self.toposorted = toposorted
+        self.resources = {}
+
+    def is_group(self):
+        return True
+
+
+class TestRequestTemplates:
+    """Tests for the job request fields shared by the jobs of a rule."""
+
+    def test_template_is_reused_for_jobs_of_a_rule(self):
+        """Test that only the per-job fields are built again for each job."""
+        executor = make_executor()
+        first = MockShellJob("rule", "echo 1", image="docker://busybox")
+        second = MockShellJob("rule", "echo 2", image="docker://busybox")
+        first.resources = {"kubernetes_memory_limit": "1Gi"}
+        second.resources = {"kubernetes_memory_limit": "1Gi"}
+
+        first_body = executor._build_job_request_body(first, first.shellcmd, "busybox")
+        second_body = executor._build_job_request_body(
+            second, second.shellcmd, "busybox"
+        )
+
+        assert len(executor.request_templates) == 1
+        assert first_body["prettified_cmd"] == "echo 1"
+        assert second_body["cmd"] == "cd /workspace && echo 2"
+        assert second_body["kubernetes_memory_limit"] == "1Gi"
+        assert second_body["workflow_uuid"] == "workflow-uuid"
+        assert "cmd" not in next(iter(executor.request_templates.values()))
+
+    def test_jobs_with_other_resources_get_their_own_template(self):
+        """Test that resources depending on wildcards are resolved per job."""
+        executor = make_executor()
+        small = MockShellJob("rule", "echo small")
+        large = MockShellJob("rule", "echo large")
+        small.resources = {"kubernetes_memory_limit": "1Gi"}
+        large.resources = {"kubernetes_memory_limit": "8Gi"}
+
+        small_body = executor._build_job_request_body(small, small.shellcmd, "image")
+        large_body = executor._build_job_request_body(large, large.shellcmd, "image")
+
+        assert len(executor.request_templates) == 2
+        assert small_body["kubernetes_memory_limit"] == "1Gi"
+        assert large_body["kubernetes_memory_limit"] == "8Gi"
+
+
+class TestGroupJobs:
+    """Tests for running Snakemake group jobs as a single REANA job."""
+
+    def test_commands_run_in_dependency_order(self):
+        """Test that group members are chained in dependency order."""
+        executor = make_executor()
+        group = MockGroupJob(
+            [
+                [MockShellJob("b", "echo b"), MockShellJob("a", "echo a")],
+                [MockShellJob("c", "cat a b > c")],
+            ]
+        )
+
+        job_request_body = executor._build_group_job_request_body(group)
+
+        assert job_request_body["prettified_cmd"] == (
+            "(echo a) && (echo b) && (cat a b > c)"
+        )
+        assert job_request_body["job_name"] == "group"
+
+    def test_different_images_are_rejected(self):
+        """Test that members using different containers cannot be grouped."""
+        executor = make_executor()
+        group = MockGroupJob(
+            [
+                [MockShellJob("a", "echo a", image="docker://python:3.12")],
+                [MockShellJob("b", "echo b", image="docker://busybox")],
+            ]
+        )
+        with pytest.raises(WorkflowError):
+            executor._build_group_job_request_body(group)
+
+    def test_python_members_are_run_by_snakemake(self):
+        """Test that groups with jobs running Python code are run by Snakemake."""
+        executor = make_executor()
+        executor.format_job_exec = MagicMock(return_value="python -m snakemake")
+        group = MockGroupJob(
+            [
+                [MockShellJob("a", "touch a", image="snakemake:9")],
+                [MockShellJob("b", None, image="snakemake:9", is_shell=False)],
+            ]
+        )
+
+        body = executor._build_group_job_request_body(group)
+
+        executor.format_job_exec.assert_called_once_with(group)
+        assert body["prettified_cmd"] == "python -m snakemake"
+
+    def test_pipe_members_are_run_by_snakemake(self):
+        """Test that groups with pipes are not chained, which would deadlock."""
+        executor = make_executor()
+        executor.format_job_exec = MagicMock(return_value="python -m snakemake")
+        group = MockGroupJob(
+            [
+                [MockShellJob("a", "seq 10 > a", image="snakemake:9", is_pipe=True)],
+                [MockShellJob("b", "wc -l a > b", image="snakemake:9")],
+            ]
+        )
+
+        body = executor._build_group_job_request_body(group)
+
+        executor.format_job_exec.assert_called_once_with(group)
+        assert body["prettified_cmd"] == "python -m snakemake"
+
+
+class TestPythonJobs:
+    """Tests for running jobs with Python code."""
+
+    def test_run_job_is_submitted(self):
+        """Test that ``run:`` jobs are submitted as Snakemake commands."""
+        executor = make_executor()
+        executor.format_job_exec = MagicMock(return_value="python -m snakemake")
+        executor._queue_job_submission = MagicMock()
+        job = MockShellJob("python", None, image="docker://snakemake:9", is_shell=False)
+        job.is_group = lambda: False
+        job.dag = MagicMock(_needrun=set(), _finished=set())
+
+        executor.run_job(job)
+
+        body = executor._queue_job_submission.call_args.args[1]
+        assert body["prettified_cmd"] == "python -m snakemake"
+        assert body["image"] == "snakemake:9"
+        assert executor.get_python_executable() == "python"
+
+    def test_run_job_without_container_fails(self, caplog):
+        """Test that ``run:`` jobs in the default environment fail at submission."""
+        executor = make_executor()
+        executor.format_job_exec = MagicMock(return_value="python -m snakemake")
+        executor._queue_job_submission = MagicMock()
+        executor.report_job_error = MagicMock()
+        job = MockShellJob("python", None, is_shell=False)
+        job.is_group = lambda: False
+        job.dag = MagicMock(_needrun=set(), _finished=set())
+
+        executor.run_job(job)
+
+        executor._queue_job_submission.assert_not_called()
+        assert executor.report_job_error.call_args.args[0].job is job
+        assert "requires a container image providing Snakemake" in caplog.text
+
+
+class TestLocalJobs:
+    """Tests for running short jobs in the engine."""
+
+    def _make_executor(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(reana_executor, "LOCAL_JOBS_MAX_RUNTIME_IN_MINUTES", 1)
+        executor = make_executor()
+        executor.workflow_workspace = str(tmp_path)
+        executor.local_job_pool = ThreadPoolExecutor(max_workers=1)
+        executor.report_job_success = MagicMock()
+        executor.report_job_error = MagicMock()
+        executor._queue_job_submission = MagicMock()
+        return executor
+
+    def _make_job(self, shellcmd, runtime):
+        job = MockShellJob("short", shellcmd)
+        job.resources = {"runtime": runtime}
+        job.is_group = lambda: False
+        job.dag = MagicMock(_needrun=set(), _finished=set())
+        return job
+
+    def test_short_job_is_run_locally(self, monkeypatch, tmp_path):
+        """Test that jobs under the runtime threshold are not submitted."""
+        executor = self._make_executor(monkeypatch, tmp_path)
+        job = self._make_job("echo done > out.txt", runtime=1)
+
+        executor.run_job(job)
+        executor.local_job_pool.shutdown(wait=True)
+
+        executor._queue_job_submission.assert_not_called()
+        assert (tmp_path / "out.txt").read_text() == "done\n"
+        assert executor.report_job_success.call_args.args[0].job is job
+        assert executor.metrics.jobs_finished.value == 1
+        executor.progress.flush()
+        message = (
+            executor.publisher._publisher.publish_workflow_status.call_args.kwargs[
+                "message"
+            ]
+        )
+        assert message["progress"]["finished"]["total"] == 1
+
+    def test_failed_local_job_is_reported(self, monkeypatch, tmp_path, caplog):
+        """Test that a local job exiting with an error is reported as failed."""
+        executor = self._make_executor(monkeypatch, tmp_path)
+        job = self._make_job("echo starting; echo no input >&2; exit 1", runtime=0.5)
+
+        with caplog.at_level(logging.INFO):
+            executor.run_job(job)
+            executor.local_job_pool.shutdown(wait=True)
+
+        executor.report_job_success.assert_not_called()
+        assert executor.report_job_error.call_args.args[0].job is job
+        assert executor.metrics.jobs_failed.value == 1
+        assert "short job output:\nstarting\nno input" in caplog.text
+        assert "short job is failed. Ran locally: exit code 1" in caplog.text
+
+    def test_long_job_is_submitted(self, monkeypatch, tmp_path):
+        """Test that jobs over or without a runtime are submitted as usual."""
+        executor = self._make_executor(monkeypatch, tmp_path)
+
+        executor.run_job(self._make_job("sleep 600", runtime=10))
+        executor.run_job(self._make_job("sleep 600", runtime=None))
+
+        assert executor._queue_job_submission.call_count == 2
+
+
+class TestCancelJobs:
+    """Tests for Executor.cancel_jobs method."""
+
+    def test_failures_are_isolated_and_retried(self, monkeypatch):
+        """Test that each job is cancelled independently of the others."""
+        monkeypatch.setattr(reana_executor, "CANCEL_JOBS_RETRY_DELAY_IN_SECONDS", 0)
+        executor = make_executor()
+        attempts = {"1": 0, "2": 0, "3": 0, "4": 0}
+
+        def delete_job(job_id, compute_backend):
+            attempts[job_id] += 1
+            if job_id == "2":
+                raise HTTPNotFound(MagicMock(status_code=404))
+            if job_id == "3":
+                raise HTTPBadGateway(MagicMock(status_code=502))
+            if job_id == "4" and attempts[job_id] == 1:
+                raise ConnectionError("connection reset")
+            return MagicMock()
+
+        executor.rjc_api_client._client.jobs.delete_job.side_effect = delete_job
+        active_jobs = [MagicMock(external_jobid=job_id) for job_id in attempts]
+        for active_job in active_jobs:
+            active_job.job.resources = {}
+
+        executor.cancel_jobs(active_jobs)
+
+        assert attempts == {"1": 1, "2": 1, "3": 3, "4": 2}
+        assert [executor._cancel_job(job) for job in active_jobs] == [
+            True,
+            True,
+            False,
+            True,
+        ]
+        status = executor.publisher._publisher.publish_workflow_status.call_args.args[1]
+        assert status == RunStatus.failed.value
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job status notifications tests."""
+
+import json
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from reana_workflow_engine_snakemake.job_status import (
+    JobStatusTable,
+    JobStatusWebhook,
+)
+
+
+class TestJobStatusWebhook:
+    """Tests for JobStatusWebhook."""
+
+    def _notify(self, webhook, notification, token="secret"):
+        """Send a job status notification to the webhook."""
+        request = Request(
+            f"http://127.0.0.1:{webhook.port}/",
+            data=json.dumps(notification).encode(),
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            method="POST",
+        )
+        with urlopen(request, timeout=5) as response:
+            return response.status
+
+    def test_notifications_update_table(self):
+        """Test that notified statuses are recorded in the table."""
+        table = JobStatusTable()
+        webhook = JobStatusWebhook(table, token="secret")
+        webhook.start()
+        try:
+            assert webhook._server.server_address[0] == "127.0.0.1"
+            assert self._notify(webhook, {"job_id": "1", "status": "finished"}) == 204
+            assert table.get_many(["1", "2"]) == {"1": "finished"}
+        finally:
+            webhook.stop()
+
+    def test_invalid_notifications_are_rejected(self):
+        """Test that notifications with unknown statuses are rejected."""
+        table = JobStatusTable()
+        webhook = JobStatusWebhook(table, token="secret")
+        webhook.start()
+        try:
+            with pytest.raises(HTTPError) as excinfo:
+                self._notify(webhook, {"job_id": "1", "status": "exploded"})
+            assert excinfo.value.code == 400
+            assert table.get_many(["1"]) == {}
+        finally:
+            webhook.stop()
+
+    def test_notifications_without_token_are_rejected(self):
+        """Test that notifications carrying a wrong token are rejected."""
+        table = JobStatusTable()
+        webhook = JobStatusWebhook(table, token="secret")
+        webhook.start()
+        try:
+            with pytest.raises(HTTPError) as excinfo:
+                self._notify(webhook, {"job_id": "1", "status": "finished"}, "guess")
+            assert excinfo.value.code == 401
+            assert table.get_many(["1"]) == {}
+        finally:
+            webhook.stop()
+
+    def test_token_is_required(self):
+        """Test that the webhook cannot be created without a token."""
+        with pytest.raises(ValueError):
+            JobStatusWebhook(JobStatusTable(), token="")
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake restart journal tests."""
+
+import os
+
+from reana_workflow_engine_snakemake.journal import JobJournal, build_job_key
+
+
+class TestJobJournal:
+    """Tests for JobJournal."""
+
+    def test_last_status_is_reloaded(self, tmp_path):
+        """Test that a restarted run sees the last status of every job."""
+        path = str(tmp_path / "reana" / "jobs.jsonl")
+        journal = JobJournal(path)
+        journal.record_submission("key-1", "1", "make", {"i": "1"})
+        journal.record_submission("key-2", "2", "make", {"i": "2"})
+        journal.update_status("1", "running")
+        journal.update_status("1", "finished")
+        journal.close()
+
+        entry = JobJournal(path).get("key-1")
+        assert entry["job_id"] == "1"
+        assert entry["rule"] == "make"
+        assert entry["wildcards"] == {"i": "1"}
+        assert entry["status"] == "finished"
+        assert JobJournal(path).get("key-2")["status"] == "created"
+
+    def test_unchanged_statuses_are_not_written(self, tmp_path):
+        """Test that polling the same status does not grow the journal."""
+        path = str(tmp_path / "jobs.jsonl")
+        journal = JobJournal(path)
+        journal.record_submission("key-1", "1", "make", {})
+        for _ in range(3):
+            journal.update_status("1", "running")
+        journal.update_status("unknown", "running")
+        journal.close()
+        with open(path) as f:
+            assert len(f.readlines()) == 2
+
+    def test_truncated_record_is_ignored(self, tmp_path):
+        """Test that a record cut short by a crash does not break loading."""
+        path = str(tmp_path / "jobs.jsonl")
+        journal = JobJournal(path)
+        journal.record_submission("key-1", "1", "make", {})
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"key": "key-1", "job_id": "1", "sta')
+
+        assert JobJournal(path).get("key-1")["status"] == "created"
+
+
+class TestBuildJobKey:
+    """Tests for build_job_key."""
+
+    def test_key_changes_with_command_and_inputs(self, tmp_path):
+        """Test that jobs running differently get different keys."""
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("a")
+        body = {"image": "python:3.12", "cmd": "cat input.txt"}
+        key = build_job_key("make", {"i": "1"}, body, [str(input_file)])
+
+        assert key == build_job_key("make", {"i": "1"}, body, [str(input_file)])
+        assert key != build_job_key("make", {"i": "2"}, body, [str(input_file)])
+        assert key != build_job_key(
+            "make", {"i": "1"}, dict(body, cmd="wc input.txt"), [str(input_file)]
+        )
+        input_file.write_text("ab")
+        os.utime(input_file, ns=(0, 0))
+        assert key != build_job_key("make", {"i": "1"}, body, [str(input_file)])
+
+    def test_key_ignores_snakemake_tmpdir(self):
+        """Test that the temporary directory of each Snakemake run is ignored."""
+        cmd = "python -m snakemake --wait-for-files '/w/.snakemake/tmp.{}' out.txt"
+        body = {"image": "snakemake:9", "cmd": cmd.format("a1b2c3")}
+        restarted = dict(body, cmd=cmd.format("x9y8z7"))
+
+        assert build_job_key("make", {}, body, []) == build_job_key(
+            "make", {}, restarted, []
+        )
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake executor metrics tests."""
+
+from unittest.mock import MagicMock
+from urllib.request import urlopen
+
+from reana_workflow_engine_snakemake.metrics import (
+    Counter,
+    ExecutorMetrics,
+    Histogram,
+    InstrumentedPublisher,
+    MetricsServer,
+)
+
+
+class TestMetrics:
+    """Tests for the metric types."""
+
+    def test_counter_rendering(self):
+        """Test that counters are rendered in the Prometheus text format."""
+        counter = Counter("jobs_total", "Jobs.")
+        counter.inc()
+        counter.inc(2)
+        assert counter.render() == (
+            "# HELP reana_snakemake_jobs_total Jobs.\n"
+            "# TYPE reana_snakemake_jobs_total counter\n"
+            "reana_snakemake_jobs_total 3"
+        )
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test that histogram buckets count all observations below them."""
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 0.7, 5):
+            histogram.observe(value)
+        assert histogram.samples() == [
+            'reana_snakemake_latency_seconds_bucket{le="0.1"} 1',
+            'reana_snakemake_latency_seconds_bucket{le="1"} 3',
+            'reana_snakemake_latency_seconds_bucket{le="+Inf"} 4',
+            "reana_snakemake_latency_seconds_sum 6.25",
+            "reana_snakemake_latency_seconds_count 4",
+        ]
+
+
+class TestExecutorMetrics:
+    """Tests for ExecutorMetrics and its exposition."""
+
+    def test_write_file(self, tmp_path):
+        """Test that all the metrics are written to the metrics file."""
+        metrics = ExecutorMetrics()
+        metrics.jobs_submitted.inc()
+        path = tmp_path / "metrics.prom"
+        metrics.write(str(path))
+        content = path.read_text()
+        assert "reana_snakemake_jobs_submitted_total 1\n" in content
+        assert "# TYPE reana_snakemake_poll_round_seconds histogram" in content
+
+    def test_server(self):
+        """Test that the metrics are served over HTTP, on localhost only."""
+        metrics = ExecutorMetrics()
+        metrics.active_jobs.set(7)
+        server = MetricsServer(metrics)
+        assert server._server.server_address[0] == "127.0.0.1"
+        server.start()
+        try:
+            with urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as r:
+                assert "reana_snakemake_active_jobs 7\n" in r.read().decode()
+        finally:
+            server.stop()
+
+    def test_instrumented_publisher(self):
+        """Test that published MQ messages are counted and timed."""
+        metrics = ExecutorMetrics()
+        publisher = MagicMock()
+        InstrumentedPublisher(publisher, metrics).publish_workflow_status("uuid", 1)
+        publisher.publish_workflow_status.assert_called_once_with("uuid", 1)
+        assert metrics.mq_published.value == 1
+        assert metrics.mq_publish_seconds.count == 1
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake job result cache tests."""
+
+from reana_workflow_engine_snakemake.result_cache import ResultCache
+
+BODY = {"image": "python:3.12", "prettified_cmd": "wc -l data.txt > counts.txt"}
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_outputs_are_restored(self, tmp_path):
+        """Test that stored files and directories are copied back."""
+        cache = ResultCache(str(tmp_path / "cache"), str(tmp_path))
+        (tmp_path / "plots").mkdir()
+        (tmp_path / "plots" / "a.png").write_text("png")
+        (tmp_path / "counts.txt").write_text("3")
+        outputs = [str(tmp_path / "counts.txt"), str(tmp_path / "plots")]
+        cache.store("abcdef", outputs)
+        (tmp_path / "counts.txt").unlink()
+        (tmp_path / "plots" / "a.png").unlink()
+
+        assert cache.restore("abcdef", outputs)
+        assert (tmp_path / "counts.txt").read_text() == "3"
+        assert (tmp_path / "plots" / "a.png").read_text() == "png"
+        assert not cache.restore("012345", outputs)
+        assert not cache.restore("abcdef", outputs[:1])
+
+    def test_key_depends_on_request_and_inputs(self, tmp_path):
+        """Test that the key changes with the command, image and input contents."""
+        cache = ResultCache(str(tmp_path / "cache"), str(tmp_path))
+        data = tmp_path / "data.txt"
+        data.write_text("1\n2\n3\n")
+        key = cache.build_key(BODY, [str(data)])
+
+        assert key == cache.build_key(dict(BODY, job_name="other"), [str(data)])
+        assert key != cache.build_key(dict(BODY, image="python:3.13"), [str(data)])
+        assert key != cache.build_key(
+            dict(BODY, prettified_cmd="wc -c data.txt > counts.txt"), [str(data)]
+        )
+        data.write_text("1\n2\n")
+        assert key != cache.build_key(BODY, [str(data)])
+        assert cache.build_key(BODY, [str(tmp_path / "missing.txt")]) is None
+
+    def test_only_outputs_in_workspace_are_cacheable(self, tmp_path):
+        """Test that jobs without outputs or writing outside are not cached."""
+        cache = ResultCache(str(tmp_path / "cache"), str(tmp_path / "workspace"))
+
+        assert cache.is_cacheable([str(tmp_path / "workspace" / "out.txt")])
+        assert not cache.is_cacheable([])
+        assert not cache.is_cacheable([str(tmp_path / "out.txt")])
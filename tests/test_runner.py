@@ -8,12 +8,23 @@
 
 """REANA-Workflow-Engine-Snakemake runner tests."""
 
+import json
 import logging
+import queue
+import threading
 from unittest.mock import patch
 
+from reana_workflow_engine_snakemake import runner
 from reana_workflow_engine_snakemake.runner import (
+    SnakemakeJSONFormatter,
+    SnakemakeLogQueueHandler,
+    SnakemakeLogSampler,
     SnakemakeLoggingFormatter,
+    _get_report_mode,
     _setup_snakemake_logging,
+    _save_report_request,
+    _stop_snakemake_logging,
+    generate_report,
 )
 
 
@@ -79,12 +90,140 @@ class TestSetupSnakemakeLogging:
             assert not isinstance(
                 snakemake_logger.handlers[0].formatter, SnakemakeLoggingFormatter
             )
-            _setup_snakemake_logging()
+            listener = _setup_snakemake_logging()
             assert snakemake_logger.propagate is False
             assert len(snakemake_logger.handlers) == 1
-            assert isinstance(
-                snakemake_logger.handlers[0].formatter, SnakemakeLoggingFormatter
-            )
+            assert isinstance(snakemake_logger.handlers[0], SnakemakeLogQueueHandler)
+            assert isinstance(listener.handlers[0].formatter, SnakemakeLoggingFormatter)
+
+            _stop_snakemake_logging(listener)
+            assert snakemake_logger.handlers == list(listener.handlers)
+            assert snakemake_logger.handlers[0].filters
+        finally:
+            snakemake_logger.handlers = old_handlers
+            snakemake_logger.propagate = old_propagate
+
+    def test_records_are_written_by_the_listener(self):
+        """Test that queued records are all written once logging is stopped."""
+        from snakemake.logging import logger as snakemake_logger
+
+        old_handlers = snakemake_logger.handlers[:]
+        old_propagate = snakemake_logger.propagate
+        old_level = snakemake_logger.level
+        try:
+            snakemake_logger.setLevel(logging.INFO)
+            listener = _setup_snakemake_logging()
+            written = []
+            listener.handlers[0].emit = written.append
+            for i in range(10):
+                snakemake_logger.info(f"message {i}")
+            _stop_snakemake_logging(listener)
+            assert [record.msg for record in written] == [
+                f"message {i}" for i in range(10)
+            ]
         finally:
             snakemake_logger.handlers = old_handlers
             snakemake_logger.propagate = old_propagate
+            snakemake_logger.setLevel(old_level)
+
+    def test_json_format(self, monkeypatch):
+        """Test that the listener writes JSON lines in the json log format."""
+        from snakemake.logging import logger as snakemake_logger
+
+        monkeypatch.setattr(runner, "SNAKEMAKE_LOG_FORMAT", "json")
+        old_handlers = snakemake_logger.handlers[:]
+        old_propagate = snakemake_logger.propagate
+        try:
+            listener = _setup_snakemake_logging()
+            _stop_snakemake_logging(listener)
+            assert isinstance(listener.handlers[0].formatter, SnakemakeJSONFormatter)
+        finally:
+            snakemake_logger.handlers = old_handlers
+            snakemake_logger.propagate = old_propagate
+
+
+class TestSnakemakeLogPipeline:
+    """Tests for the queue, sampling and JSON output of Snakemake log records."""
+
+    def _make_record(self, msg="hello", level=logging.INFO, **extra):
+        """Create a log record with Snakemake extra attributes."""
+        record = logging.LogRecord("snakemake", level, "", 0, msg, None, None)
+        record.__dict__.update(extra)
+        return record
+
+    def test_sampler_keeps_one_record_in_n(self):
+        """Test that high-volume events are sampled and others are kept."""
+        sampler = SnakemakeLogSampler(3, ["shellcmd"])
+
+        kept = [sampler.filter(self._make_record(event="shellcmd")) for _ in range(7)]
+
+        assert kept == [True, False, False, True, False, False, True]
+        assert sampler.filter(self._make_record(event="progress"))
+        assert sampler.filter(self._make_record(event="shellcmd", level=logging.ERROR))
+        assert not SnakemakeLogSampler(0, ["shellcmd"]).filter(
+            self._make_record(event="shellcmd")
+        )
+
+    def test_queue_handler_drops_records_when_full(self):
+        """Test that logging never blocks when the queue is full."""
+        handler = SnakemakeLogQueueHandler(queue.Queue(2))
+
+        for i in range(5):
+            handler.handle(self._make_record(f"message {i}"))
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_queue_handler_keeps_warnings_when_full(self):
+        """Test that warnings wait for room in the queue instead of being dropped."""
+        handler = SnakemakeLogQueueHandler(queue.Queue(1))
+        handler.handle(self._make_record("info"))
+        warning = self._make_record("warning", level=logging.WARNING)
+        logged = threading.Thread(target=handler.handle, args=(warning,))
+
+        logged.start()
+        assert handler.queue.get(timeout=5).getMessage() == "info"
+        logged.join(timeout=5)
+
+        assert not logged.is_alive()
+        assert handler.queue.get_nowait() is warning
+        assert handler.dropped == 0
+
+    def test_json_formatter(self):
+        """Test that records are written as JSON objects with their job fields."""
+        formatter = SnakemakeJSONFormatter()
+        record = self._make_record("Finished job 3.", jobid=3)
+
+        entry = json.loads(formatter.format(record))
+
+        assert entry["message"] == "Finished job 3."
+        assert entry["level"] == "INFO"
+        assert entry["jobid"] == 3
+        assert formatter.format(self._make_record("")) == ""
+
+
+class TestReportMode:
+    """Tests for the report generation modes."""
+
+    def test_operational_option_overrides_default(self):
+        """Test that the report mode can be chosen per workflow."""
+        assert _get_report_mode({}) == "sync"
+        assert _get_report_mode({"report_mode": "off"}) == "off"
+
+    def test_unknown_mode_falls_back_to_default(self):
+        """Test that an unknown report mode generates the report as usual."""
+        assert _get_report_mode({"report_mode": "later"}) == "sync"
+
+    def test_lazy_report_is_generated_on_demand(self, tmp_path):
+        """Test that a report left for later is generated once from its settings."""
+        (tmp_path / "Snakefile").write_text(
+            'rule a:\n    output: "a.txt"\n    shell: "echo {config[x]} > {output}"\n'
+        )
+        _save_report_request(str(tmp_path), "Snakefile", {"x": 1}, "report.zip")
+
+        with patch.object(runner, "_generate_report") as generate:
+            assert generate_report(str(tmp_path))
+            assert not generate_report(str(tmp_path))
+
+        generate.assert_called_once()
+        assert generate.call_args.args[1:] == (str(tmp_path), "report.zip")
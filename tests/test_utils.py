@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of REANA.
+# Copyright (C) 2026 CERN.
+#
+# REANA is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""REANA-Workflow-Engine-Snakemake utilities tests."""
+
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+from reana_workflow_engine_snakemake import utils
+from reana_workflow_engine_snakemake.config import JobStatus, RunStatus
+from reana_workflow_engine_snakemake.utils import (
+    AdaptiveConcurrencyLimit,
+    AdaptivePollInterval,
+    CriticalPathPriority,
+    WorkflowIdentity,
+    WorkflowProgress,
+    get_workflow_identity,
+    set_workflow_identity,
+)
+
+
+class MockRule:
+    """Mock rule object for testing."""
+
+    def __init__(self, norun=False):
+        self.norun = norun
+
+
+class MockJob:
+    """Mock job object for testing."""
+
+    def __init__(self, dag=None, norun=False):
+        self.dag = dag
+        self.rule = MockRule(norun=norun)
+        self.is_local = norun
+
+
+class TestWorkflowProgress:
+    """Tests for WorkflowProgress."""
+
+    def _make_job(self):
+        """Create a job belonging to a DAG of three jobs, one of them norun."""
+        dag = MagicMock()
+        dag._needrun = {MockJob(), MockJob(norun=True)}
+        dag._finished = {MockJob()}
+        dag.get_job_group.return_value = None
+        return MockJob(dag=dag)
+
+    def test_start_is_published_once(self):
+        """Test that the workflow start is computed and published only once."""
+        publisher = MagicMock()
+        progress = WorkflowProgress("workflow-uuid", publisher)
+        job = self._make_job()
+
+        progress.start(job)
+        progress.start(job)
+
+        assert progress.total == 2
+        assert publisher.publish_workflow_status.call_count == 1
+        message = publisher.publish_workflow_status.call_args.kwargs["message"]
+        assert message["progress"]["total"]["total"] == 2
+
+    def test_group_is_counted_once(self):
+        """Test that the jobs of a group are counted as a single REANA job."""
+        grouped, other = MockJob(), MockJob()
+        dag = MagicMock()
+        dag._needrun = {grouped, MockJob(), other}
+        dag._finished = set()
+        dag.get_job_group.side_effect = lambda j: None if j is other else "group"
+
+        progress = WorkflowProgress("workflow-uuid", MagicMock())
+        progress.start(MockJob(dag=dag))
+
+        assert progress.total == 2
+
+    def test_counters(self):
+        """Test that job events update the counters incrementally."""
+        progress = WorkflowProgress("workflow-uuid", MagicMock())
+        progress.job_submitted("1")
+        progress.job_submitted("2")
+        progress.job_submitted("3")
+        progress.job_status_changed("1", JobStatus.finished, RunStatus.running)
+        progress.job_status_changed("2", JobStatus.failed, RunStatus.failed)
+
+        assert progress.running == 1
+        assert progress.finished == 1
+        assert progress.failed == 1
+
+    def test_events_are_coalesced(self):
+        """Test that buffered job events are published in a single message."""
+        publisher = MagicMock()
+        progress = WorkflowProgress(
+            "workflow-uuid", publisher, flush_interval=3600, batch_size=3
+        )
+        progress.job_submitted("1")
+        progress.job_submitted("2")
+        assert publisher.publish_workflow_status.call_count == 0
+
+        progress.job_status_changed("1", JobStatus.finished, RunStatus.running)
+        assert publisher.publish_workflow_status.call_count == 1
+        status = publisher.publish_workflow_status.call_args.args[1]
+        message = publisher.publish_workflow_status.call_args.kwargs["message"]
+        assert status == RunStatus.running.value
+        assert message["progress"]["running"] == {"total": 2, "job_ids": ["1", "2"]}
+        assert message["progress"]["finished"] == {"total": 1, "job_ids": ["1"]}
+
+    def test_jobs_without_reana_job_id_are_published(self):
+        """Test that jobs not run by job-controller count towards the progress."""
+        publisher = MagicMock()
+        progress = WorkflowProgress("workflow-uuid", publisher, flush_interval=3600)
+        progress.job_status_changed(None, JobStatus.finished, RunStatus.running)
+        progress.job_status_changed(None, JobStatus.finished, RunStatus.running)
+        progress.flush()
+
+        message = publisher.publish_workflow_status.call_args.kwargs["message"]
+        finished = message["progress"]["finished"]
+        assert finished["total"] == 2
+        assert len(set(finished["job_ids"])) == 2
+        assert progress.finished == 2
+
+    def test_workflow_failure_is_flushed_immediately(self):
+        """Test that a failed workflow is published together with pending events."""
+        publisher = MagicMock()
+        progress = WorkflowProgress("workflow-uuid", publisher, flush_interval=3600)
+        progress.job_submitted("1")
+        progress.job_status_changed("1", JobStatus.failed, RunStatus.failed)
+
+        assert publisher.publish_workflow_status.call_count == 1
+        status = publisher.publish_workflow_status.call_args.args[1]
+        message = publisher.publish_workflow_status.call_args.kwargs["message"]
+        assert status == RunStatus.failed.value
+        assert message["progress"]["failed"] == {"total": 1, "job_ids": ["1"]}
+
+    def test_flush_without_events(self):
+        """Test that flushing an empty buffer does not publish anything."""
+        publisher = MagicMock()
+        progress = WorkflowProgress("workflow-uuid", publisher)
+        progress.flush()
+        progress.flush_if_due()
+        assert publisher.publish_workflow_status.call_count == 0
+
+
+class TestAdaptivePollInterval:
+    """Tests for AdaptivePollInterval."""
+
+    def test_shortens_while_jobs_finish(self):
+        """Test that the interval shrinks down to the floor."""
+        interval = AdaptivePollInterval(initial=10, floor=2, ceiling=60)
+        assert interval.next(1, [], now=0) == 5
+        assert interval.next(3, [], now=0) == 2.5
+        assert interval.next(1, [], now=0) == 2
+
+    def test_backs_off_while_nothing_changes(self):
+        """Test that the interval grows up to the ceiling."""
+        interval = AdaptivePollInterval(initial=10, floor=2, ceiling=20)
+        assert interval.next(0, [], now=0) == 15
+        assert interval.next(0, [], now=0) == 20
+        assert interval.next(0, [], now=0) == 20
+
+    def test_wakes_up_for_expected_completion(self):
+        """Test that observed rule runtimes shorten the wait."""
+        interval = AdaptivePollInterval(initial=10, floor=1, ceiling=60)
+        interval.job_done("short", submitted_at=0, now=30)
+        active_jobs = [("short", 100), ("unknown", 100)]
+        assert interval.next(0, active_jobs, now=126) == 4
+        assert interval.next(0, active_jobs, now=129.5) == 1
+
+    def test_overdue_jobs_do_not_hold_interval_at_floor(self):
+        """Test that jobs running past their expected runtime let it back off."""
+        interval = AdaptivePollInterval(initial=10, floor=1, ceiling=60)
+        interval.job_done("short", submitted_at=0, now=30)
+        active_jobs = [("short", 100)]
+        assert interval.next(0, active_jobs, now=135) == 15
+        assert interval.next(0, active_jobs, now=150) == 22.5
+
+
+class TestAdaptiveConcurrencyLimit:
+    """Tests for AdaptiveConcurrencyLimit."""
+
+    def _make_limit(self, initial=4):
+        """Create a limit between 1 and 100 jobs."""
+        return AdaptiveConcurrencyLimit(
+            initial=initial,
+            floor=1,
+            ceiling=100,
+            latency_threshold=5,
+            queued_ratio=0.5,
+            decrease_interval=10,
+        )
+
+    def test_grows_until_overload(self):
+        """Test that the limit doubles every round until the first decrease."""
+        limit = self._make_limit()
+        for _ in range(4):
+            limit.job_finished()
+        assert limit.current == 8
+
+        limit.job_submitted(latency=6, now=0)
+        assert limit.current == 4
+        for _ in range(4):
+            limit.job_finished()
+        assert limit.current == 4
+        limit.job_finished()
+        assert limit.current == 5
+
+    def test_decreases_at_most_once_per_interval(self):
+        """Test that a burst of overload signals halves the limit only once."""
+        limit = self._make_limit(initial=64)
+        limit.submission_failed(now=0)
+        limit.jobs_checked(active_jobs=10, queued_jobs=6, now=5)
+        assert limit.current == 32
+        limit.jobs_checked(active_jobs=10, queued_jobs=6, now=10)
+        assert limit.current == 16
+
+    def test_stays_within_bounds(self):
+        """Test that the limit never leaves the floor and ceiling."""
+        limit = self._make_limit(initial=2)
+        limit.jobs_checked(active_jobs=10, queued_jobs=2, now=0)
+        limit.job_submitted(latency=1, now=0)
+        assert limit.current == 2
+        for now in (0, 10, 20):
+            limit.submission_failed(now=now)
+        assert limit.current == 1
+        limit.slow_start = True
+        for _ in range(200):
+            limit.job_finished()
+        assert limit.current == 100
+
+
+class MockDAGJob:
+    """Mock job of a DAG for critical path tests."""
+
+    def __init__(self, dag, name, runtime=None):
+        self.dag = dag
+        self.name = name
+        self.resources = {"runtime": runtime} if runtime else {}
+
+    def is_group(self):
+        return False
+
+
+class MockDAG:
+    """Mock DAG made of levels of jobs, each depending on the previous level."""
+
+    def __init__(self):
+        self.levels = []
+        self.depending = {}
+
+    def add_level(self, *jobs):
+        for job in jobs:
+            self.depending[job] = {}
+        for previous_job in self.levels[-1] if self.levels else []:
+            self.depending[previous_job] = {job: set() for job in jobs}
+        self.levels.append(list(jobs))
+
+    def needrun_jobs(self):
+        return [job for level in self.levels for job in level]
+
+    def toposorted(self, jobs):
+        return iter(self.levels)
+
+
+class TestCriticalPathPriority:
+    """Tests for CriticalPathPriority."""
+
+    def test_longest_chain_comes_first(self):
+        """Test that jobs holding up longer or slower chains rank higher."""
+        dag = MockDAG()
+        short, long, slow = (
+            MockDAGJob(dag, "short"),
+            MockDAGJob(dag, "long"),
+            MockDAGJob(dag, "slow", runtime=10),
+        )
+        dag.add_level(short, long, slow)
+        middle = MockDAGJob(dag, "middle")
+        dag.depending.update({long: {middle: set()}, middle: {}})
+        dag.levels.append([middle])
+        priority = CriticalPathPriority()
+
+        assert priority.get(short) == 1
+        assert priority.get(long) == 2
+        assert priority.get(slow) == 10
+        assert priority.get(middle) == 1
+
+    def test_dag_is_not_modified(self):
+        """Test that jobs missing from ``dag.depending`` are not added to it."""
+        dag = MockDAG()
+        job = MockDAGJob(dag, "job")
+        dag.add_level(job)
+        dag.depending = defaultdict(dict)
+
+        assert CriticalPathPriority().get(job) == 1
+        assert job not in dag.depending
+
+    def test_group_ranks_as_its_longest_member(self):
+        """Test that a group job gets the largest length of its jobs."""
+        dag = MockDAG()
+        first, second = MockDAGJob(dag, "first"), MockDAGJob(dag, "second")
+        dag.add_level(first)
+        dag.add_level(second)
+        group = MagicMock(jobs={first, second})
+        group.is_group.return_value = True
+
+        assert CriticalPathPriority().get(group) == 2
+
+    def test_new_jobs_trigger_recomputation(self):
+        """Test that jobs added to the DAG after a checkpoint are ranked."""
+        dag = MockDAG()
+        first = MockDAGJob(dag, "first")
+        dag.add_level(first)
+        priority = CriticalPathPriority()
+        assert priority.get(first) == 1
+
+        second = MockDAGJob(dag, "second")
+        dag.add_level(second)
+        assert priority.get(second) == 1
+        assert priority.get(first) == 2
+
+
+class TestWorkflowIdentity:
+    """Tests for the identity of the workflow run."""
+
+    def test_identity_set_by_the_engine_is_used(self, monkeypatch):
+        """Test that the identity set on start is preferred to the environment."""
+        monkeypatch.setenv("workflow_uuid", "env-uuid")
+        monkeypatch.setenv("workflow_workspace", "/env")
+        monkeypatch.setattr(utils, "_workflow_identity", None)
+        assert get_workflow_identity() == WorkflowIdentity("env-uuid", "/env")
+
+        set_workflow_identity("workflow-uuid", "/workspace")
+        assert get_workflow_identity() == WorkflowIdentity(
+            "workflow-uuid", "/workspace"
+        )